@@ -0,0 +1,235 @@
+"""
+Async Base Azure DevOps API Client
+
+This module provides the asynchronous counterpart of the base client.
+It lets callers issue independent Azure DevOps requests concurrently
+(e.g. with asyncio.gather) over a shared HTTP/2 connection pool.
+"""
+
+import asyncio
+import random
+from typing import Dict, List, Optional, Any, Union
+
+import httpx
+
+from backend.azure.base_client import (
+    CONNECT_TIMEOUT,
+    READ_TIMEOUT,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_BACKOFF_JITTER,
+    RETRY_BACKOFF_MAX,
+    RETRY_STATUSES,
+    RETRY_TOTAL,
+    THROTTLE_STATUSES,
+    _decode_body,
+    _encode_body,
+    _encode_pat,
+)
+from backend.settings import organization_url, personal_access_token, pool_size
+
+
+class AsyncBaseAzureClient:
+    """
+    Asynchronous base client for interacting with Azure DevOps API.
+    Mirrors BaseAzureClient but is backed by a shared httpx.AsyncClient.
+    """
+
+    __slots__ = (
+        "organization_url",
+        "personal_access_token",
+        "headers",
+        "_client",
+        "_inflight",
+    )
+
+    def __init__(self):
+        """Initialize the async Azure DevOps client with settings from config."""
+        self.organization_url = organization_url
+        self.personal_access_token = personal_access_token
+        self.headers = self._get_auth_headers()
+        self._client = httpx.AsyncClient(
+            base_url=self.organization_url or "",
+            headers=self.headers,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=pool_size, max_keepalive_connections=16
+            ),
+            timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+        )
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+
+    def _get_auth_headers(self) -> Dict[str, str]:
+        """
+        Create authentication headers using personal access token.
+
+        Returns:
+            Dict[str, str]: Headers with authentication information
+        """
+        return {
+            "Authorization": f"Basic {_encode_pat(self.personal_access_token)}",
+            "Content-Type": "application/json",
+        }
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        api_version: str = "6.0",
+        data: Optional[Union[Dict, List, bytes]] = None,
+        params: Optional[Dict] = None,
+        content_type: Optional[str] = None,
+        coalesce: bool = False,
+        retry_server_errors: bool = True,
+    ) -> Any:
+        """
+        Make an asynchronous request to the Azure DevOps API.
+
+        Args:
+            method (str): HTTP method (GET, POST, PATCH, DELETE)
+            endpoint (str): API endpoint (without organization URL)
+            api_version (str, optional): API version. Defaults to "6.0".
+            data (Optional[Union[Dict, List, bytes]], optional): Request body, or
+                pre-encoded JSON bytes. Defaults to None.
+            params (Optional[Dict], optional): Query parameters. Defaults to None.
+            content_type (Optional[str], optional): Custom content type. Defaults to None.
+            coalesce (bool, optional): Share one in-flight request between concurrent
+                identical GETs. Defaults to False.
+            retry_server_errors (bool, optional): Retry 5xx responses as well as
+                throttling. Pass False for non-idempotent writes. Defaults to True.
+
+        Returns:
+            Any: Response data as dictionary or raw content
+
+        Raises:
+            Exception: If the request fails
+        """
+        if not (coalesce and method == "GET"):
+            return await self._send_request(
+                method,
+                endpoint,
+                api_version,
+                data,
+                params,
+                content_type,
+                retry_server_errors,
+            )
+
+        key = (
+            endpoint,
+            api_version,
+            tuple(sorted((params or {}).items())),
+            content_type,
+        )
+        # No await between lookup and registration, so this is atomic on the loop.
+        # The shared request runs in its own task and every caller awaits it
+        # through shield, so cancelling one caller never cancels the others
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._send_request(
+                    method, endpoint, api_version, data, params, content_type
+                )
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._request_done(key, done))
+        return await asyncio.shield(task)
+
+    def _request_done(self, key: tuple, task: asyncio.Task) -> None:
+        """
+        Forget a finished coalesced request.
+
+        Args:
+            key (tuple): Coalescing key the task was registered under
+            task (asyncio.Task): The finished request task
+        """
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved when every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        api_version: str = "6.0",
+        data: Optional[Union[Dict, List, bytes]] = None,
+        params: Optional[Dict] = None,
+        content_type: Optional[str] = None,
+        retry_server_errors: bool = True,
+    ) -> Any:
+        """
+        Send a request over the shared async connection pool.
+
+        Args:
+            method (str): HTTP method (GET, POST, PATCH, DELETE)
+            endpoint (str): API endpoint (without organization URL)
+            api_version (str, optional): API version. Defaults to "6.0".
+            data (Optional[Union[Dict, List, bytes]], optional): Request body, or
+                pre-encoded JSON bytes. Defaults to None.
+            params (Optional[Dict], optional): Query parameters. Defaults to None.
+            content_type (Optional[str], optional): Custom content type. Defaults to None.
+            retry_server_errors (bool, optional): Retry 5xx responses as well as
+                throttling. POSTs are only retried when throttled regardless.
+                Defaults to True.
+
+        Returns:
+            Any: Response data as dictionary or raw content
+
+        Raises:
+            Exception: If the request fails
+        """
+        # Add API version to params
+        if params is None:
+            params = {}
+        params["api-version"] = api_version
+
+        json_data = _encode_body(data)
+
+        # Only override headers when a custom content type is requested
+        headers = {"Content-Type": content_type} if content_type else None
+
+        # Mirror the sync session's retry policy: POSTs may not be idempotent, so
+        # they are only retried when throttled, never after a server error
+        if retry_server_errors and method.upper() != "POST":
+            retry_statuses = RETRY_STATUSES
+        else:
+            retry_statuses = THROTTLE_STATUSES
+        for attempt in range(RETRY_TOTAL + 1):
+            response = await self._client.request(
+                method, endpoint, headers=headers, params=params, content=json_data
+            )
+            if response.status_code not in retry_statuses or attempt == RETRY_TOTAL:
+                break
+            await asyncio.sleep(self._retry_delay(response, attempt))
+
+        # Check if request was successful
+        if response.status_code >= 200 and response.status_code < 300:
+            return _decode_body(response.content)
+        else:
+            error_message = f"Request failed with status code {response.status_code}: {response.text}"
+            raise Exception(error_message)
+
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        """
+        Compute how long to wait before retrying a throttled or failed request.
+
+        Args:
+            response (httpx.Response): The response that triggered the retry
+            attempt (int): Zero-based number of the attempt that just failed
+
+        Returns:
+            float: Delay in seconds
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+
+        backoff = RETRY_BACKOFF_FACTOR * (2**attempt)
+        backoff += random.uniform(0, RETRY_BACKOFF_JITTER)
+        return min(backoff, RETRY_BACKOFF_MAX)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
@@ -7,11 +7,110 @@ It handles authentication and common request functionality.
 
 import requests
 import base64
-import json
+import functools
+import orjson
 import os
-from typing import Dict, List, Optional, Any, Union
+import socket
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Iterator, List, Optional, Any, Union
 
-from backend.settings import organization_url, personal_access_token
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from backend.settings import organization_url, personal_access_token, pool_size
+
+# Sentinel distinguishing a cache miss from a cached empty response
+_MISSING = object()
+
+# Retry policy shared by the sync and async clients: throttling (429) and
+# transient server errors back off exponentially with jitter, honouring
+# Retry-After when the server sends it
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_BACKOFF_JITTER = 0.5
+RETRY_BACKOFF_MAX = 60
+
+# Non-idempotent writes (POSTs such as creating work items, pull requests or
+# comments) are only retried when throttled: a 5xx or a lost response may come
+# after the server applied them
+THROTTLE_STATUSES = frozenset([429])
+IDEMPOTENT_METHODS = frozenset(["GET", "PATCH", "DELETE"])
+ALL_METHODS = IDEMPOTENT_METHODS | {"POST"}
+
+# Timeouts in seconds shared by the sync and async clients; a short connect
+# timeout fails fast on an unreachable host while reads may take longer
+CONNECT_TIMEOUT = 5.0
+READ_TIMEOUT = 30.0
+
+# Keep Nagle disabled (urllib3's default) and have the OS probe idle pooled
+# sockets so half-closed keep-alive connections are detected early
+_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+@functools.lru_cache(maxsize=4)
+def _encode_pat(personal_access_token: str) -> str:
+    """
+    Base64-encode a personal access token for Basic auth, once per token.
+
+    Args:
+        personal_access_token (str): Azure DevOps personal access token
+
+    Returns:
+        str: Encoded credentials for the Authorization header
+    """
+    return base64.b64encode(f":{personal_access_token}".encode()).decode()
+
+
+def _encode_body(data: Any) -> Optional[bytes]:
+    """
+    Encode a request body as JSON with orjson, which yields UTF-8 bytes directly.
+
+    Args:
+        data (Any): Body to encode, or bytes that are already JSON-encoded
+
+    Returns:
+        Optional[bytes]: Encoded body, or None when there is no body
+    """
+    if isinstance(data, bytes):
+        return data
+    return orjson.dumps(data) if data else None
+
+
+def _decode_body(content: bytes) -> Any:
+    """
+    Decode a response body with orjson, falling back to the raw bytes for non-JSON payloads.
+
+    Args:
+        content (bytes): Response body
+
+    Returns:
+        Any: Response data as dictionary or raw content
+    """
+    try:
+        return orjson.loads(content) if content else {}
+    except orjson.JSONDecodeError:
+        return content
+
+
+class _ThrottleRetry(Retry):
+    """Retry that only honours Retry-After on throttled responses, not on 503/413."""
+
+    RETRY_AFTER_STATUS_CODES = THROTTLE_STATUSES
+
+
+class _PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections use _SOCKET_OPTIONS."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = _SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
 
 
 class BaseAzureClient:
@@ -20,11 +119,92 @@ class BaseAzureClient:
     Provides core functionality used by all specialized clients.
     """
 
+    __slots__ = (
+        "organization_url",
+        "personal_access_token",
+        "headers",
+        "_session",
+        "_write_session",
+        "_cache",
+        "_cache_lock",
+        "_inflight",
+    )
+
     def __init__(self):
         """Initialize the base Azure DevOps client with settings from config."""
         self.organization_url = organization_url
         self.personal_access_token = personal_access_token
         self.headers = self._get_auth_headers()
+        self._session = self._create_session()
+        self._write_session = self._create_session(retry_server_errors=False)
+        self._cache = TTLCache(maxsize=2048, ttl=300)
+        self._cache_lock = threading.RLock()
+        self._inflight: Dict[tuple, Future] = {}
+
+        # Opt-in: open the TLS connection in the background so the first real
+        # request finds a warm socket in the pool
+        if os.getenv("AZDO_WARMUP") == "1":
+            self.warmup()
+
+    def warmup(self) -> None:
+        """Open a pooled connection to the organization URL on a daemon thread."""
+        if not self.organization_url:
+            return
+        threading.Thread(target=self._warm_connection, daemon=True).start()
+
+    def _warm_connection(self) -> None:
+        """Issue a HEAD request to establish a keep-alive connection."""
+        try:
+            self._session.head(self.organization_url, timeout=5)
+        except requests.RequestException:
+            # Warmup is best effort; the real request will connect on its own
+            pass
+
+    def _create_session(self, retry_server_errors: bool = True) -> requests.Session:
+        """
+        Create a pooled HTTP session so connections are kept alive between calls.
+
+        Args:
+            retry_server_errors (bool, optional): Also retry 5xx responses and read
+                errors for idempotent methods. When False only throttled (429)
+                requests are retried, which is safe for non-idempotent writes.
+                Defaults to True.
+
+        Returns:
+            requests.Session: Session carrying the default headers and retry policy
+        """
+        session = requests.Session()
+        retry_class = Retry if retry_server_errors else _ThrottleRetry
+        adapter = _PooledAdapter(
+            pool_connections=16,
+            pool_maxsize=pool_size,
+            max_retries=retry_class(
+                total=RETRY_TOTAL,
+                read=None if retry_server_errors else 0,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                backoff_jitter=RETRY_BACKOFF_JITTER,
+                backoff_max=RETRY_BACKOFF_MAX,
+                status_forcelist=(
+                    RETRY_STATUSES if retry_server_errors else THROTTLE_STATUSES
+                ),
+                allowed_methods=(
+                    IDEMPOTENT_METHODS if retry_server_errors else ALL_METHODS
+                ),
+                respect_retry_after_header=True,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(self.headers)
+        # Ask for compressed bodies; urllib3 only lists "br" when a brotli
+        # decoder is installed, so every advertised encoding can be decoded
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        return session
+
+    def close(self) -> None:
+        """Close the pooled HTTP sessions and their connections."""
+        self._session.close()
+        self._write_session.close()
 
     def _get_auth_headers(self) -> Dict[str, str]:
         """
@@ -33,11 +213,8 @@ class BaseAzureClient:
         Returns:
             Dict[str, str]: Headers with authentication information
         """
-        encoded_pat = base64.b64encode(
-            f":{self.personal_access_token}".encode()
-        ).decode()
         return {
-            "Authorization": f"Basic {encoded_pat}",
+            "Authorization": f"Basic {_encode_pat(self.personal_access_token)}",
             "Content-Type": "application/json",
         }
 
@@ -46,9 +223,11 @@ class BaseAzureClient:
         method: str,
         endpoint: str,
         api_version: str = "6.0",
-        data: Optional[Dict] = None,
+        data: Optional[Union[Dict, List, bytes]] = None,
         params: Optional[Dict] = None,
         content_type: Optional[str] = None,
+        cacheable: bool = False,
+        retry_server_errors: bool = True,
     ) -> Any:
         """
         Make a request to the Azure DevOps API.
@@ -57,13 +236,258 @@ class BaseAzureClient:
             method (str): HTTP method (GET, POST, PATCH, DELETE)
             endpoint (str): API endpoint (without organization URL)
             api_version (str, optional): API version. Defaults to "6.0".
-            data (Optional[Dict], optional): Request body. Defaults to None.
+            data (Optional[Union[Dict, List, bytes]], optional): Request body, or
+                pre-encoded JSON bytes. Defaults to None.
             params (Optional[Dict], optional): Query parameters. Defaults to None.
             content_type (Optional[str], optional): Custom content type. Defaults to None.
+            cacheable (bool, optional): Serve GET responses from the TTL cache and
+                coalesce concurrent identical GETs. Defaults to False.
+            retry_server_errors (bool, optional): Retry 5xx responses and read errors
+                as well as throttling. Pass False for non-idempotent writes. Defaults to True.
 
         Returns:
             Any: Response data as dictionary or raw content
 
+        Raises:
+            Exception: If the request fails
+        """
+        # Serve idempotent GETs from the cache when the caller opts in
+        if not (cacheable and method == "GET"):
+            return self._send_request(
+                method,
+                endpoint,
+                api_version,
+                data,
+                params,
+                content_type,
+                retry_server_errors,
+            )
+
+        cache_key = self._cache_key(endpoint, api_version, params, content_type)
+        return self._get_cached(
+            cache_key,
+            lambda: self._send_request(
+                method, endpoint, api_version, data, params, content_type
+            ),
+        )
+
+    def _list_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        api_version: str = "6.0",
+        cacheable: bool = False,
+        skip_page_size: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Collect the items of every page of a list endpoint.
+
+        Args:
+            endpoint (str): API endpoint (without organization URL)
+            params (Optional[Dict], optional): Query parameters. Defaults to None.
+            api_version (str, optional): API version. Defaults to "6.0".
+            cacheable (bool, optional): Serve the collected list from the TTL cache. Defaults to False.
+            skip_page_size (Optional[int], optional): Page with "$top"/"$skip" in pages of
+                this size, for endpoints that send no continuation token. Defaults to None.
+
+        Returns:
+            List[Dict]: Items from the "value" field of all pages
+        """
+        if not cacheable:
+            return list(self._iter_pages(endpoint, params, api_version, skip_page_size))
+
+        cache_key = self._cache_key(endpoint, api_version, params, paged=True)
+        return self._get_cached(
+            cache_key,
+            lambda: list(
+                self._iter_pages(endpoint, params, api_version, skip_page_size)
+            ),
+        )
+
+    def _iter_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        api_version: str = "6.0",
+        skip_page_size: Optional[int] = None,
+    ) -> Iterator[Dict]:
+        """
+        Stream the items of a list endpoint, following its pagination.
+
+        Pages are chained with continuation tokens, or, when skip_page_size is
+        given, with "$top"/"$skip" until a page comes back short; endpoints such
+        as pull requests and commits only support the latter. Either way pages
+        are only followed when the caller did not set "$top", so an explicit
+        limit is never exceeded.
+
+        Args:
+            endpoint (str): API endpoint (without organization URL)
+            params (Optional[Dict], optional): Query parameters. Defaults to None.
+            api_version (str, optional): API version. Defaults to "6.0".
+            skip_page_size (Optional[int], optional): Page with "$top"/"$skip" in pages of
+                this size instead of following continuation tokens. Defaults to None.
+
+        Yields:
+            Dict: Items from the "value" field of each page
+        """
+        params = dict(params or {})
+        follow_tokens = "$top" not in params
+        skip_paging = follow_tokens and skip_page_size is not None
+        if skip_paging:
+            params["$top"] = skip_page_size
+            params["$skip"] = int(params.get("$skip") or 0)
+
+        while True:
+            response = self._make_request_raw(
+                "GET", endpoint, api_version, params=params
+            )
+            page = self._parse_response(response).get("value", [])
+            yield from page
+
+            if skip_paging:
+                if len(page) < skip_page_size:
+                    return
+                params["$skip"] += skip_page_size
+                continue
+
+            token = response.headers.get("x-ms-continuationtoken")
+            if not (follow_tokens and token):
+                return
+            params["continuationToken"] = token
+
+    def _cache_key(
+        self,
+        endpoint: str,
+        api_version: str,
+        params: Optional[Dict],
+        content_type: Optional[str] = None,
+        paged: bool = False,
+    ) -> tuple:
+        """
+        Build the cache key for a GET request.
+
+        Returns:
+            tuple: Hashable key whose first element is the endpoint
+        """
+        return (
+            endpoint,
+            api_version,
+            tuple(sorted((params or {}).items())),
+            content_type,
+            paged,
+        )
+
+    def _get_cached(self, cache_key: tuple, loader: Callable[[], Any]) -> Any:
+        """
+        Return a cached value, loading it at most once across concurrent callers.
+
+        Args:
+            cache_key (tuple): Key built by _cache_key
+            loader (Callable[[], Any]): Performs the request on a cache miss
+
+        Returns:
+            Any: The cached or freshly loaded value
+        """
+        with self._cache_lock:
+            cached = self._cache.get(cache_key, _MISSING)
+            if cached is not _MISSING:
+                return cached
+
+            # Coalesce concurrent identical GETs onto a single in-flight request
+            future = self._inflight.get(cache_key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[cache_key] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = loader()
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            with self._cache_lock:
+                self._cache[cache_key] = result
+            return result
+        finally:
+            with self._cache_lock:
+                self._inflight.pop(cache_key, None)
+
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        api_version: str = "6.0",
+        data: Optional[Union[Dict, List, bytes]] = None,
+        params: Optional[Dict] = None,
+        content_type: Optional[str] = None,
+        retry_server_errors: bool = True,
+    ) -> Any:
+        """
+        Send a request over the pooled session, bypassing the response cache.
+
+        Args:
+            method (str): HTTP method (GET, POST, PATCH, DELETE)
+            endpoint (str): API endpoint (without organization URL)
+            api_version (str, optional): API version. Defaults to "6.0".
+            data (Optional[Union[Dict, List, bytes]], optional): Request body, or
+                pre-encoded JSON bytes. Defaults to None.
+            params (Optional[Dict], optional): Query parameters. Defaults to None.
+            content_type (Optional[str], optional): Custom content type. Defaults to None.
+            retry_server_errors (bool, optional): Retry 5xx responses and read errors
+                as well as throttling. Defaults to True.
+
+        Returns:
+            Any: Response data as dictionary or raw content
+
+        Raises:
+            Exception: If the request fails
+        """
+        response = self._make_request_raw(
+            method,
+            endpoint,
+            api_version,
+            data,
+            params,
+            content_type,
+            retry_server_errors=retry_server_errors,
+        )
+        return self._parse_response(response)
+
+    def _make_request_raw(
+        self,
+        method: str,
+        endpoint: str,
+        api_version: str = "6.0",
+        data: Optional[Union[Dict, List, bytes]] = None,
+        params: Optional[Dict] = None,
+        content_type: Optional[str] = None,
+        stream: bool = False,
+        retry_server_errors: bool = True,
+    ) -> requests.Response:
+        """
+        Send a request and return the raw response so headers stay accessible.
+
+        Args:
+            method (str): HTTP method (GET, POST, PATCH, DELETE)
+            endpoint (str): API endpoint (without organization URL)
+            api_version (str, optional): API version. Defaults to "6.0".
+            data (Optional[Union[Dict, List, bytes]], optional): Request body, or
+                pre-encoded JSON bytes. Defaults to None.
+            params (Optional[Dict], optional): Query parameters. Defaults to None.
+            content_type (Optional[str], optional): Custom content type. Defaults to None.
+            stream (bool, optional): Defer downloading the body. Defaults to False.
+            retry_server_errors (bool, optional): Retry 5xx responses and read errors
+                as well as throttling. POSTs are only retried when throttled
+                regardless. Defaults to True.
+
+        Returns:
+            requests.Response: The successful response
+
         Raises:
             Exception: If the request fails
         """
@@ -74,25 +498,120 @@ class BaseAzureClient:
             params = {}
         params["api-version"] = api_version
 
-        # Convert data to JSON if provided
-        json_data = json.dumps(data) if data else None
+        # Session headers carry auth and the default content type; only the
+        # override needs its own dict, which requests merges on top
+        headers = {"Content-Type": content_type} if content_type else None
 
-        # Create headers with optional custom content type
-        headers = self.headers.copy()
-        if content_type:
-            headers["Content-Type"] = content_type
+        body = _encode_body(data)
 
-        # Make the request
-        response = requests.request(
-            method=method, url=url, headers=headers, params=params, data=json_data
+        # Make the request over the pooled session; POSTs always use the
+        # throttle-only session so they are never resubmitted after a 5xx
+        if retry_server_errors and method.upper() != "POST":
+            session = self._session
+        else:
+            session = self._write_session
+        response = session.request(
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+            data=body,
+            stream=stream,
+            timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
         )
 
         # Check if request was successful
         if response.status_code >= 200 and response.status_code < 300:
-            try:
-                return response.json() if response.content else {}
-            except json.JSONDecodeError:
-                return response.content
+            return response
         else:
             error_message = f"Request failed with status code {response.status_code}: {response.text}"
             raise Exception(error_message)
+
+    def _iter_content(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        api_version: str = "6.0",
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[bytes]:
+        """
+        Stream a GET response body in chunks instead of buffering it whole.
+
+        Args:
+            endpoint (str): API endpoint (without organization URL)
+            params (Optional[Dict], optional): Query parameters. Defaults to None.
+            api_version (str, optional): API version. Defaults to "6.0".
+            chunk_size (int, optional): Bytes per chunk. Defaults to 64 KiB.
+
+        Yields:
+            bytes: Consecutive chunks of the response body
+        """
+        response = self._make_request_raw(
+            "GET", endpoint, api_version, params=params, stream=True
+        )
+        with response:
+            yield from response.iter_content(chunk_size)
+
+    def _iter_json_items(
+        self,
+        method: str,
+        endpoint: str,
+        prefix: str = "value.item",
+        data: Optional[Union[Dict, List, bytes]] = None,
+        params: Optional[Dict] = None,
+        api_version: str = "6.0",
+    ) -> Iterator[Any]:
+        """
+        Stream the items of a JSON array in the response without loading the whole body.
+
+        Args:
+            method (str): HTTP method (GET, POST)
+            endpoint (str): API endpoint (without organization URL)
+            prefix (str, optional): ijson path of the items to yield. Defaults to "value.item".
+            data (Optional[Union[Dict, List, bytes]], optional): Request body, or
+                pre-encoded JSON bytes. Defaults to None.
+            params (Optional[Dict], optional): Query parameters. Defaults to None.
+            api_version (str, optional): API version. Defaults to "6.0".
+
+        Yields:
+            Any: Each item as it is parsed off the socket
+        """
+        # Imported here so only callers that stream pay for loading the parser
+        import ijson
+
+        response = self._make_request_raw(
+            method, endpoint, api_version, data=data, params=params, stream=True
+        )
+        with response:
+            # Let urllib3 undo gzip/brotli before the bytes reach the parser
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, prefix, use_float=True)
+
+    @staticmethod
+    def _parse_response(response: requests.Response) -> Any:
+        """
+        Decode a successful response body.
+
+        Args:
+            response (requests.Response): Response returned by _make_request_raw
+
+        Returns:
+            Any: Response data as dictionary or raw content
+        """
+        return _decode_body(response.content)
+
+    def bust_cache(self, fragment: str = "") -> None:
+        """
+        Invalidate cached GET responses whose endpoint contains the given fragment.
+
+        Args:
+            fragment (str, optional): Case-insensitive endpoint fragment, e.g.
+                "/pullrequests/42". An empty fragment clears the whole cache.
+        """
+        fragment = fragment.lower()
+        with self._cache_lock:
+            if not fragment:
+                self._cache.clear()
+                return
+            for key in [k for k in self._cache.keys() if fragment in k[0].lower()]:
+                self._cache.pop(key, None)
@@ -5,19 +5,19 @@ This module provides the main client for Azure DevOps API interactions.
 It uses composition to organize functionality into domain-specific resources.
 """
 
-import sys
-import os
+from __future__ import annotations
 
-# Add the parent directory to sys.path to allow relative imports
-sys.path.append(
-    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
+from typing import TYPE_CHECKING
 
 # Local imports
 from backend.azure.base_client import BaseAzureClient
-from backend.azure.work_items import WorkItemsResource
-from backend.azure.git import GitResource
-from backend.azure.projects import ProjectsResource
+
+# Resource modules are imported lazily by their properties to keep cold start cheap
+if TYPE_CHECKING:
+    from backend.azure.async_client import AsyncBaseAzureClient
+    from backend.azure.work_items import WorkItemsResource
+    from backend.azure.git import GitResource
+    from backend.azure.projects import ProjectsResource
 
 
 class AzureDevOpsClient:
@@ -26,9 +26,18 @@ class AzureDevOpsClient:
     Uses composition to provide access to different API resources.
     """
 
+    __slots__ = (
+        "_base_client",
+        "_async_base_client",
+        "_work_items",
+        "_git",
+        "_projects",
+    )
+
     def __init__(self):
         """Initialize the Azure DevOps client with resource handlers."""
         self._base_client = BaseAzureClient()
+        self._async_base_client = None
         self._work_items = None
         self._git = None
         self._projects = None
@@ -42,7 +51,11 @@ class AzureDevOpsClient:
             WorkItemsResource: Handler for work item operations
         """
         if self._work_items is None:
-            self._work_items = WorkItemsResource(self._base_client)
+            from backend.azure.work_items import WorkItemsResource
+
+            self._work_items = WorkItemsResource(
+                self._base_client, self.async_base_client
+            )
         return self._work_items
 
     @property
@@ -54,9 +67,25 @@ class AzureDevOpsClient:
             GitResource: Handler for git repository operations
         """
         if self._git is None:
-            self._git = GitResource(self._base_client)
+            from backend.azure.git import GitResource
+
+            self._git = GitResource(self._base_client, self.async_base_client)
         return self._git
 
+    @property
+    def async_base_client(self) -> AsyncBaseAzureClient:
+        """
+        Get the shared async base client used by the async resource methods.
+
+        Returns:
+            AsyncBaseAzureClient: Async client backed by an HTTP/2 connection pool
+        """
+        if self._async_base_client is None:
+            from backend.azure.async_client import AsyncBaseAzureClient
+
+            self._async_base_client = AsyncBaseAzureClient()
+        return self._async_base_client
+
     @property
     def projects(self) -> ProjectsResource:
         """
@@ -66,9 +95,15 @@ class AzureDevOpsClient:
             ProjectsResource: Handler for project operations
         """
         if self._projects is None:
+            from backend.azure.projects import ProjectsResource
+
             self._projects = ProjectsResource(self._base_client)
         return self._projects
 
+    def close(self) -> None:
+        """Close the connection pool of the sync base client."""
+        self._base_client.close()
+
     # Convenience method to make direct requests when needed
     def make_request(self, method, endpoint, api_version="6.0", data=None, params=None):
         """
@@ -4,7 +4,94 @@ Git Resource
 This module provides a specialized resource handler for Azure DevOps Git repository operations.
 """
 
-from typing import Dict, List, Any, Optional
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from typing import IO, AsyncIterator, Dict, Iterator, List, Any, Optional, Tuple
+
+from backend.azure.models import Branch, Commit, PullRequest
+
+
+class ThreadStatus(IntEnum):
+    """Numeric status values of a pull request comment thread."""
+
+    active = 1
+    fixed = 2
+    wontFix = 3
+    closed = 4
+    byDesign = 5
+    pending = 6
+
+
+class CommentType(IntEnum):
+    """Numeric type values of a pull request comment."""
+
+    text = 1
+    codeChange = 2
+    system = 3
+
+
+# Lookup tables from the API's string names to their numeric values
+_STATUS_MAP = {status.name: int(status) for status in ThreadStatus}
+_COMMENT_TYPE_MAP = {
+    comment_type.name: int(comment_type) for comment_type in CommentType
+}
+
+# Page size for list endpoints that page with $top/$skip instead of
+# continuation tokens (pull requests and commits)
+SKIP_PAGE_SIZE = 100
+
+# Endpoint templates; {proj_prefix} is "<project_id>/" or "" for org-scoped calls.
+# Repository-scoped paths share one prefix and a single pullRequests spelling.
+_REPO_SCOPED = "/{proj_prefix}_apis/git/repositories/{repo}"
+_PR_SCOPED = _REPO_SCOPED + "/pullRequests/{pr}"
+
+_ENDPOINTS = {
+    "repositories": "/{proj_prefix}_apis/git/repositories",
+    "repository": _REPO_SCOPED,
+    "items": _REPO_SCOPED + "/items",
+    "blob": _REPO_SCOPED + "/blobs/{sha}",
+    "diffs": _REPO_SCOPED + "/diffs/commits",
+    "refs": _REPO_SCOPED + "/refs",
+    "commits": _REPO_SCOPED + "/commits",
+    "project_pull_requests": "/{proj_prefix}_apis/git/pullrequests",
+    "pull_requests": _REPO_SCOPED + "/pullRequests",
+    "pull_request_by_id": "/_apis/git/pullrequests/{pr}",
+    "pull_request": _PR_SCOPED,
+    "threads": _PR_SCOPED + "/threads",
+    "thread": _PR_SCOPED + "/threads/{thread}",
+    "thread_comment": _PR_SCOPED + "/threads/{thread}/comments/{cid}",
+}
+
+
+def _endpoint(name: str, project_id: Optional[str] = None, **parts: Any) -> str:
+    """
+    Build an endpoint from its template in a single formatting pass.
+
+    Args:
+        name (str): Key into the endpoint template table
+        project_id (Optional[str]): Project ID or name used as URL prefix, if any
+        **parts: Values for the remaining template fields
+
+    Returns:
+        str: The endpoint path (without organization URL)
+    """
+    parts["proj_prefix"] = f"{project_id}/" if project_id else ""
+    return _ENDPOINTS[name].format_map(parts)
+
+
+def _as_branch_ref(name: str) -> str:
+    """
+    Qualify a branch name as a ref, leaving already-qualified refs untouched.
+
+    Args:
+        name (str): Branch name (e.g. 'main') or full ref (e.g. 'refs/heads/main')
+
+    Returns:
+        str: Full ref name
+    """
+    return name if name.startswith("refs/") else f"refs/heads/{name}"
 
 
 class GitResource:
@@ -12,14 +99,18 @@ class GitResource:
     Resource handler for Azure DevOps Git repository operations.
     """
 
-    def __init__(self, base_client):
+    __slots__ = ("_client", "_async_client")
+
+    def __init__(self, base_client, async_base_client=None):
         """
         Initialize the Git resource handler.
 
         Args:
             base_client: The base Azure client for making API requests
+            async_base_client: Optional async Azure client used by the ``a``-prefixed methods
         """
         self._client = base_client
+        self._async_client = async_base_client
 
     def get_repositories(self, project: Optional[str] = None) -> List[Dict]:
         """
@@ -32,15 +123,26 @@ class GitResource:
         Returns:
             List[Dict]: List of repositories
         """
-        if project:
-            # Get repositories for a specific project
-            endpoint = f"/{project}/_apis/git/repositories"
-        else:
-            # Get all repositories in the organization
-            endpoint = "/_apis/git/repositories"
+        endpoint = self._repositories_endpoint(project)
+        return self._client._list_pages(endpoint, cacheable=True)
 
-        response = self._client._make_request("GET", endpoint)
-        return response.get("value", [])
+    def iter_repositories(self, project: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Stream Git repositories page by page.
+
+        Args:
+            project (Optional[str]): Project name or ID. If provided, only repositories
+                                    in this project will be returned.
+
+        Returns:
+            Iterator[Dict]: Repositories, fetched lazily across pages
+        """
+        endpoint = self._repositories_endpoint(project)
+        return self._client._iter_pages(endpoint)
+
+    def _repositories_endpoint(self, project: Optional[str]) -> str:
+        """Build the repository listing endpoint, scoped to a project if given."""
+        return _endpoint("repositories", project)
 
     def get_file_content(self, repository_id: str, ref: str, path: str) -> str:
         """
@@ -54,11 +156,74 @@ class GitResource:
         Returns:
             str: File content
         """
-        endpoint = f"/_apis/git/repositories/{repository_id}/items/{path}?versionType=Branch&version={ref}"
+        endpoint = _endpoint("items", repo=repository_id)
+        # Pass path and ref as query params so they get URL-encoded properly
+        params = {"path": path, "versionType": "Branch", "version": ref}
 
-        response = self._client._make_request("GET", endpoint)
+        response = self._client._make_request("GET", endpoint, params=params)
         return response
 
+    def get_blob_content(self, repository_id: str, object_id: str) -> bytes:
+        """
+        Get the raw content of a Git blob by its object ID.
+
+        Unlike get_file_content, the result depends only on the object ID, so it
+        never changes when a branch moves.
+
+        Args:
+            repository_id (str): ID of the repository
+            object_id (str): SHA-1 of the blob
+
+        Returns:
+            bytes: Blob content
+        """
+        endpoint = _endpoint("blob", repo=repository_id, sha=object_id)
+        params = {"$format": "octetstream"}
+
+        response = self._client._make_request_raw("GET", endpoint, params=params)
+        return response.content
+
+    def stream_file_content(
+        self,
+        repository_id: str,
+        ref: str,
+        path: str,
+        sink: IO[bytes],
+        chunk_size: int = 64 * 1024,
+    ) -> int:
+        """
+        Stream the raw content of a file into a writable binary sink.
+
+        Unlike get_file_content, the file is never held in memory as a whole,
+        which keeps memory flat when downloading large blobs.
+
+        Args:
+            repository_id (str): ID of the repository
+            ref (str): Reference (branch, tag, commit) for the file
+            path (str): Path to the file
+            sink (IO[bytes]): File-like object the content is written to
+            chunk_size (int): Bytes read per chunk. Defaults to 64 KiB.
+
+        Returns:
+            int: Number of bytes written
+        """
+        endpoint = _endpoint("items", repo=repository_id)
+        params = {
+            "path": path,
+            "versionType": "Branch",
+            "version": ref,
+            "download": "true",
+            "$format": "octetStream",
+        }
+
+        written = 0
+        for chunk in self._client._iter_content(
+            endpoint, params, chunk_size=chunk_size
+        ):
+            sink.write(chunk)
+            written += len(chunk)
+        return written
+
     def get_branch_diff(
         self, repository_id: str, base_version: str, target_version: str
     ) -> Dict:
@@ -73,7 +238,7 @@ class GitResource:
         Returns:
             Dict: JSON response containing the diff information
         """
-        endpoint = f"/_apis/git/repositories/{repository_id}/diffs/commits"
+        endpoint = _endpoint("diffs", repo=repository_id)
         params = {"baseVersion": base_version, "targetVersion": target_version}
         diffs = self._client._make_request("GET", endpoint, params=params)
         return diffs
@@ -88,8 +253,9 @@ class GitResource:
         Returns:
             Dict: Repository data
         """
-        endpoint = f"/_apis/git/repositories/{repository_id}"
-        return self._client._make_request("GET", endpoint)
+        endpoint = _endpoint("repository", repo=repository_id)
+        # Repository metadata rarely changes, so serve repeats from the response cache
+        return self._client._make_request("GET", endpoint, cacheable=True)
 
     def get_branches(
         self, repository_id: str, filter_prefix: Optional[str] = None
@@ -104,7 +270,48 @@ class GitResource:
         Returns:
             List[Dict]: List of branches
         """
-        endpoint = f"/_apis/git/repositories/{repository_id}/refs"
+        endpoint, params = self._branches_query(repository_id, filter_prefix)
+        return self._client._list_pages(endpoint, params, cacheable=True)
+
+    def iter_branches(
+        self, repository_id: str, filter_prefix: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        Stream branches of a Git repository page by page.
+
+        Args:
+            repository_id (str): ID of the repository
+            filter_prefix (Optional[str]): Filter branches by prefix
+
+        Returns:
+            Iterator[Dict]: Branches, fetched lazily across pages
+        """
+        endpoint, params = self._branches_query(repository_id, filter_prefix)
+        return self._client._iter_pages(endpoint, params)
+
+    def get_branches_typed(
+        self, repository_id: str, filter_prefix: Optional[str] = None
+    ) -> List[Branch]:
+        """
+        Get all branches in a Git repository as typed views.
+
+        Args:
+            repository_id (str): ID of the repository
+            filter_prefix (Optional[str]): Filter branches by prefix
+
+        Returns:
+            List[Branch]: List of branches
+        """
+        return [
+            Branch.from_api(value)
+            for value in self.get_branches(repository_id, filter_prefix)
+        ]
+
+    def _branches_query(
+        self, repository_id: str, filter_prefix: Optional[str]
+    ) -> Tuple[str, Dict]:
+        """Build the endpoint and query params for listing branches."""
+        endpoint = _endpoint("refs", repo=repository_id)
 
         params = {}
         if filter_prefix:
@@ -112,8 +319,7 @@ class GitResource:
         else:
             params["filter"] = "heads/"
 
-        response = self._client._make_request("GET", endpoint, params=params)
-        return response.get("value", [])
+        return endpoint, params
 
     def get_commits(
         self,
@@ -130,9 +336,41 @@ class GitResource:
             top (Optional[int]): Maximum number of commits to return
 
         Returns:
-            List[Dict]: List of commits
+            List[Dict]: List of commits from a single request; use iter_commits
+                to page through the full history
+        """
+        endpoint, params = self._commits_query(repository_id, branch, top)
+        response = self._client._make_request("GET", endpoint, params=params)
+        return response.get("value", [])
+
+    def iter_commits(
+        self,
+        repository_id: str,
+        branch: Optional[str] = None,
+        top: Optional[int] = None,
+    ) -> Iterator[Dict]:
+        """
+        Stream commits of a Git repository page by page.
+
+        Without top this walks the whole history, so callers should stop
+        iterating once they have what they need.
+
+        Args:
+            repository_id (str): ID of the repository
+            branch (Optional[str]): Branch name to get commits from
+            top (Optional[int]): Maximum number of commits to return
+
+        Returns:
+            Iterator[Dict]: Commits, fetched lazily across pages
         """
-        endpoint = f"/_apis/git/repositories/{repository_id}/commits"
+        endpoint, params = self._commits_query(repository_id, branch, top)
+        return self._client._iter_pages(endpoint, params, skip_page_size=SKIP_PAGE_SIZE)
+
+    def _commits_query(
+        self, repository_id: str, branch: Optional[str], top: Optional[int]
+    ) -> Tuple[str, Dict]:
+        """Build the endpoint and query params for listing commits."""
+        endpoint = _endpoint("commits", repo=repository_id)
 
         params = {}
         if branch:
@@ -140,8 +378,29 @@ class GitResource:
         if top:
             params["$top"] = top
 
-        response = self._client._make_request("GET", endpoint, params=params)
-        return response.get("value", [])
+        return endpoint, params
+
+    def get_commits_typed(
+        self,
+        repository_id: str,
+        branch: Optional[str] = None,
+        top: Optional[int] = None,
+    ) -> List[Commit]:
+        """
+        Get commits in a Git repository as typed views.
+
+        Args:
+            repository_id (str): ID of the repository
+            branch (Optional[str]): Branch name to get commits from
+            top (Optional[int]): Maximum number of commits to return
+
+        Returns:
+            List[Commit]: List of commits
+        """
+        return [
+            Commit.from_api(value)
+            for value in self.get_commits(repository_id, branch, top)
+        ]
 
     def get_project_pull_requests(
         self,
@@ -160,8 +419,73 @@ class GitResource:
             skip (Optional[int]): Number of pull requests to skip (for pagination)
 
         Returns:
-            List[Dict]: List of pull requests with their details
+            List[Dict]: List of pull requests with their details, from a single
+                request; use iter_project_pull_requests to page through them all
+        """
+        endpoint, params = self._project_pull_requests_query(
+            project_id, status, top, skip
+        )
+        return self._client._list_pages(endpoint, params, cacheable=True)
+
+    def iter_project_pull_requests(
+        self,
+        project_id: str,
+        status: Optional[str] = "active",
+        top: Optional[int] = None,
+        skip: Optional[int] = None,
+    ) -> Iterator[Dict]:
+        """
+        Stream pull requests for a specific project page by page.
+
+        Without top this walks every matching pull request, so callers should
+        stop iterating once they have what they need.
+
+        Args:
+            project_id (str): Project ID or name
+            status (Optional[str]): Filter by PR status ("active", "completed", "abandoned", or "all")
+            top (Optional[int]): Maximum number of pull requests to retrieve
+            skip (Optional[int]): Number of pull requests to skip (for pagination)
+
+        Returns:
+            Iterator[Dict]: Pull requests, fetched lazily across pages
         """
+        endpoint, params = self._project_pull_requests_query(
+            project_id, status, top, skip
+        )
+        return self._client._iter_pages(endpoint, params, skip_page_size=SKIP_PAGE_SIZE)
+
+    def get_project_pull_requests_typed(
+        self,
+        project_id: str,
+        status: Optional[str] = "active",
+        top: Optional[int] = None,
+        skip: Optional[int] = None,
+    ) -> List[PullRequest]:
+        """
+        Get pull requests for a specific project as typed views.
+
+        Args:
+            project_id (str): Project ID or name
+            status (Optional[str]): Filter by PR status ("active", "completed", "abandoned", or "all")
+            top (Optional[int]): Maximum number of pull requests to retrieve
+            skip (Optional[int]): Number of pull requests to skip (for pagination)
+
+        Returns:
+            List[PullRequest]: List of pull requests
+        """
+        return [
+            PullRequest.from_api(value)
+            for value in self.get_project_pull_requests(project_id, status, top, skip)
+        ]
+
+    def _project_pull_requests_query(
+        self,
+        project_id: str,
+        status: Optional[str],
+        top: Optional[int],
+        skip: Optional[int],
+    ) -> Tuple[str, Dict]:
+        """Build the endpoint and query params for listing project pull requests."""
         # Build search criteria
         search_criteria = {}
         if status and status.lower() != "all":
@@ -175,14 +499,13 @@ class GitResource:
             params["$skip"] = skip
 
         # Get pull requests using the Git resource handler
-        endpoint = f"/{project_id}/_apis/git/pullrequests"
+        endpoint = _endpoint("project_pull_requests", project_id)
 
         # Add search criteria to params
         for key, value in search_criteria.items():
             params[f"searchCriteria.{key}"] = value
 
-        response = self._client._make_request("GET", endpoint, params=params)
-        return response.get("value", [])
+        return endpoint, params
 
     def get_pull_requests(
         self, repository_id: str, status: Optional[str] = "active"
@@ -196,16 +519,63 @@ class GitResource:
                                    (active, abandoned, completed, all)
 
         Returns:
-            List[Dict]: List of pull requests
+            List[Dict]: List of pull requests from a single request; use
+                iter_pull_requests to page through them all
+        """
+        endpoint, params = self._pull_requests_query(repository_id, status)
+        response = self._client._make_request("GET", endpoint, params=params)
+        return response.get("value", [])
+
+    def iter_pull_requests(
+        self, repository_id: str, status: Optional[str] = "active"
+    ) -> Iterator[Dict]:
+        """
+        Stream pull requests in a Git repository page by page.
+
+        This walks every matching pull request, so callers should stop
+        iterating once they have what they need.
+
+        Args:
+            repository_id (str): ID of the repository
+            status (Optional[str]): Status of pull requests to get
+                                   (active, abandoned, completed, all)
+
+        Returns:
+            Iterator[Dict]: Pull requests, fetched lazily across pages
         """
-        endpoint = f"/_apis/git/repositories/{repository_id}/pullrequests"
+        endpoint, params = self._pull_requests_query(repository_id, status)
+        return self._client._iter_pages(endpoint, params, skip_page_size=SKIP_PAGE_SIZE)
+
+    def _pull_requests_query(
+        self, repository_id: str, status: Optional[str]
+    ) -> Tuple[str, Dict]:
+        """Build the endpoint and query params for listing repository pull requests."""
+        endpoint = _endpoint("pull_requests", repo=repository_id)
 
         params = {}
         if status:
             params["searchCriteria.status"] = status
 
-        response = self._client._make_request("GET", endpoint, params=params)
-        return response.get("value", [])
+        return endpoint, params
+
+    def get_pull_requests_typed(
+        self, repository_id: str, status: Optional[str] = "active"
+    ) -> List[PullRequest]:
+        """
+        Get pull requests in a Git repository as typed views.
+
+        Args:
+            repository_id (str): ID of the repository
+            status (Optional[str]): Status of pull requests to get
+                                   (active, abandoned, completed, all)
+
+        Returns:
+            List[PullRequest]: List of pull requests
+        """
+        return [
+            PullRequest.from_api(value)
+            for value in self.get_pull_requests(repository_id, status)
+        ]
 
     def get_pull_request_details(
         self,
@@ -225,7 +595,7 @@ class GitResource:
             Dict: Pull request details including metadata, commits (if requested), and work items (if requested)
         """
         # Build the endpoint URL
-        endpoint = f"/_apis/git/pullrequests/{pull_request_id}"
+        endpoint = _endpoint("pull_request_by_id", pr=pull_request_id)
 
         # Add optional parameters
         params = {}
@@ -235,7 +605,43 @@ class GitResource:
             params["includeWorkItemRefs"] = "true"
 
         # Get the PR details
-        return self._client._make_request("GET", endpoint, params=params)
+        return self._client._make_request(
+            "GET", endpoint, params=params, cacheable=True
+        )
+
+    def get_pull_requests_by_ids(
+        self,
+        pull_request_ids: List[int],
+        include_commits: bool = False,
+        include_work_items: bool = False,
+    ) -> Dict[int, Dict]:
+        """
+        Get details for several pull requests, fetching them concurrently.
+
+        Azure DevOps has no endpoint that returns pull requests by a list of IDs
+        (pullRequestQuery matches commits, not PR IDs), so the lookups are issued
+        in parallel over the pooled session instead of one after another.
+
+        Args:
+            pull_request_ids (List[int]): IDs of the pull requests to retrieve
+            include_commits (bool): If true, include the associated commits
+            include_work_items (bool): If true, include the associated work item references
+
+        Returns:
+            Dict[int, Dict]: Pull request details keyed by pull request ID
+        """
+        unique_ids = list(dict.fromkeys(pull_request_ids))
+        if not unique_ids:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(16, len(unique_ids))) as executor:
+            details = executor.map(
+                lambda pr_id: self.get_pull_request_details(
+                    pr_id, include_commits, include_work_items
+                ),
+                unique_ids,
+            )
+            return dict(zip(unique_ids, details))
 
     def create_pull_request(
         self,
@@ -260,11 +666,11 @@ class GitResource:
         Returns:
             Dict: Created pull request data
         """
-        endpoint = f"/_apis/git/repositories/{repository_id}/pullrequests"
+        endpoint = _endpoint("pull_requests", repo=repository_id)
 
         data = {
-            "sourceRefName": f"refs/heads/{source_branch}",
-            "targetRefName": f"refs/heads/{target_branch}",
+            "sourceRefName": _as_branch_ref(source_branch),
+            "targetRefName": _as_branch_ref(target_branch),
             "title": title,
         }
 
@@ -274,7 +680,11 @@ class GitResource:
         if reviewers:
             data["reviewers"] = [{"id": reviewer_id} for reviewer_id in reviewers]
 
-        return self._client._make_request("POST", endpoint, data=data)
+        response = self._client._make_request(
+            "POST", endpoint, data=data, retry_server_errors=False
+        )
+        self._client.bust_cache("/pullrequests")
+        return response
 
     def update_pull_request(
         self,
@@ -311,10 +721,9 @@ class GitResource:
             Dict: Updated pull request data
         """
         # Build the endpoint URL
-        if project_id:
-            endpoint = f"/{project_id}/_apis/git/repositories/{repository_id}/pullrequests/{pull_request_id}"
-        else:
-            endpoint = f"/_apis/git/repositories/{repository_id}/pullrequests/{pull_request_id}"
+        endpoint = _endpoint(
+            "pull_request", project_id, repo=repository_id, pr=pull_request_id
+        )
 
         # Build the update data
         data = {}
@@ -330,11 +739,7 @@ class GitResource:
             data["status"] = status
 
         if target_ref_name is not None:
-            data["targetRefName"] = (
-                f"refs/heads/{target_ref_name}"
-                if not target_ref_name.startswith("refs/")
-                else target_ref_name
-            )
+            data["targetRefName"] = _as_branch_ref(target_ref_name)
 
         if completion_options is not None:
             data["completionOptions"] = completion_options
@@ -346,9 +751,11 @@ class GitResource:
             data["autoCompleteSetBy"] = {"id": auto_complete_set_by_id}
 
         # Make the PATCH request to update the pull request
-        return self._client._make_request(
+        response = self._client._make_request(
             "PATCH", endpoint, data=data, api_version="7.2-preview.2"
         )
+        self._client.bust_cache("/pullrequests")
+        return response
 
     def create_pull_request_thread(
         self,
@@ -383,32 +790,18 @@ class GitResource:
         Returns:
             Dict: Created comment thread data
         """
-        # Map the status string to numeric value
-        status_map = {
-            "active": 1,
-            "fixed": 2,
-            "wontFix": 3,
-            "closed": 4,
-            "byDesign": 5,
-            "pending": 6,
-        }
-        numeric_status = status_map.get(status, 1)  # Default to active if not found
+        # Map the status string to numeric value, defaulting to active
+        numeric_status = _STATUS_MAP.get(status, ThreadStatus.active.value)
 
-        # Map the comment type string to numeric value
-        comment_type_map = {
-            "text": 1,
-            "codeChange": 2,
-            "system": 3,
-        }
-        numeric_comment_type = comment_type_map.get(
-            comment_type, 1
-        )  # Default to text if not found
+        # Map the comment type string to numeric value, defaulting to text
+        numeric_comment_type = _COMMENT_TYPE_MAP.get(
+            comment_type, CommentType.text.value
+        )
 
         # Build the endpoint URL
-        if project_id:
-            endpoint = f"/{project_id}/_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/threads"
-        else:
-            endpoint = f"/_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/threads"
+        endpoint = _endpoint(
+            "threads", project_id, repo=repository_id, pr=pull_request_id
+        )
 
         # Build the comment data
         comment = {
@@ -436,9 +829,15 @@ class GitResource:
             data["pullRequestThreadContext"] = {"iterationContext": iteration_context}
 
         # Make the POST request to create the comment thread
-        return self._client._make_request(
-            "POST", endpoint, data=data, api_version="7.2-preview.1"
+        response = self._client._make_request(
+            "POST",
+            endpoint,
+            data=data,
+            api_version="7.2-preview.1",
+            retry_server_errors=False,
         )
+        self._client.bust_cache(f"/pullrequests/{pull_request_id}/threads")
+        return response
 
     def get_pull_request_threads(
         self,
@@ -462,16 +861,13 @@ class GitResource:
             Dict: Pull request comment threads
         """
         # Build the endpoint URL
-        if project_id:
-            if thread_id:
-                endpoint = f"/{project_id}/_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/threads/{thread_id}"
-            else:
-                endpoint = f"/{project_id}/_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/threads"
-        else:
-            if thread_id:
-                endpoint = f"/_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/threads/{thread_id}"
-            else:
-                endpoint = f"/_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/threads"
+        endpoint = _endpoint(
+            "thread" if thread_id else "threads",
+            project_id,
+            repo=repository_id,
+            pr=pull_request_id,
+            thread=thread_id,
+        )
 
         # Add query parameters
         params = {}
@@ -499,12 +895,20 @@ class GitResource:
             Dict: Response indicating success or failure
         """
         # Build the endpoint URL
-        endpoint = f"/_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/threads/{thread_id}/comments/{comment_id}"
+        endpoint = _endpoint(
+            "thread_comment",
+            repo=repository_id,
+            pr=pull_request_id,
+            thread=thread_id,
+            cid=comment_id,
+        )
 
         # Make the DELETE request to remove the comment
-        return self._client._make_request(
+        response = self._client._make_request(
             "DELETE", endpoint, api_version="7.2-preview.1"
         )
+        self._client.bust_cache(f"/pullrequests/{pull_request_id}/threads")
+        return response
 
     def update_pull_request_comment(
         self,
@@ -528,12 +932,224 @@ class GitResource:
             Dict: Updated comment information
         """
         # Build the endpoint URL
-        endpoint = f"/_apis/git/repositories/{repository_id}/pullRequests/{pull_request_id}/threads/{thread_id}/comments/{comment_id}"
+        endpoint = _endpoint(
+            "thread_comment",
+            repo=repository_id,
+            pr=pull_request_id,
+            thread=thread_id,
+            cid=comment_id,
+        )
 
         # Prepare the request body with the updated content
         request_body = {"content": content}
 
         # Make the PATCH request to update the comment
-        return self._client._make_request(
+        response = self._client._make_request(
             "PATCH", endpoint, data=request_body, api_version="7.2-preview.1"
         )
+        self._client.bust_cache(f"/pullrequests/{pull_request_id}/threads")
+        return response
+
+    # Async variants of the read endpoints, meant to be fanned out with asyncio.gather
+
+    async def aget_repositories(self, project: Optional[str] = None) -> List[Dict]:
+        """
+        Asynchronously get all Git repositories in the organization or in a specific project.
+
+        Args:
+            project (Optional[str]): Project name or ID. If provided, only repositories
+                                    in this project will be returned.
+
+        Returns:
+            List[Dict]: List of repositories
+        """
+        endpoint = self._repositories_endpoint(project)
+
+        response = await self._async_client._make_request(
+            "GET", endpoint, coalesce=True
+        )
+        return response.get("value", [])
+
+    async def aget_file_content(self, repository_id: str, ref: str, path: str) -> str:
+        """
+        Asynchronously get the content of a file in a Git repository.
+
+        Args:
+            repository_id (str): ID of the repository
+            ref (str): Reference (branch, tag, commit) for the file
+            path (str): Path to the file
+
+        Returns:
+            str: File content
+        """
+        endpoint = _endpoint("items", repo=repository_id)
+        params = {"path": path, "versionType": "Branch", "version": ref}
+
+        return await self._async_client._make_request("GET", endpoint, params=params)
+
+    async def aget_branch_diff(
+        self, repository_id: str, base_version: str, target_version: str
+    ) -> Dict:
+        """
+        Asynchronously get the diff between two branches in a repository
+
+        Args:
+            repository_id (str): ID of the Git repository
+            base_version (str): Base branch name (e.g., 'develop')
+            target_version (str): Target branch name (e.g., 'master')
+
+        Returns:
+            Dict: JSON response containing the diff information
+        """
+        endpoint = _endpoint("diffs", repo=repository_id)
+        params = {"baseVersion": base_version, "targetVersion": target_version}
+        return await self._async_client._make_request("GET", endpoint, params=params)
+
+    async def aget_pull_request_details(
+        self,
+        pull_request_id: int,
+        include_commits: bool = False,
+        include_work_items: bool = False,
+    ) -> Dict:
+        """
+        Asynchronously get detailed information about a specific pull request.
+
+        Args:
+            pull_request_id (int): The ID of the pull request to retrieve
+            include_commits (bool): If true, the pull request will be returned with the associated commits
+            include_work_items (bool): If true, the pull request will be returned with the associated work item references
+
+        Returns:
+            Dict: Pull request details including metadata, commits (if requested), and work items (if requested)
+        """
+        endpoint = _endpoint("pull_request_by_id", pr=pull_request_id)
+
+        params = {}
+        if include_commits:
+            params["includeCommits"] = "true"
+        if include_work_items:
+            params["includeWorkItemRefs"] = "true"
+
+        return await self._async_client._make_request(
+            "GET", endpoint, params=params, coalesce=True
+        )
+
+    async def aiter_project_pull_requests(
+        self,
+        project_id: str,
+        status: Optional[str] = "active",
+        page_size: int = 100,
+        prefetch: int = 4,
+    ) -> AsyncIterator[Dict]:
+        """
+        Asynchronously stream pull requests for a project, prefetching pages.
+
+        Up to ``prefetch`` $top/$skip pages are in flight at once, so the next
+        pages download while the caller consumes the current one. Streaming
+        stops at the first page with fewer than ``page_size`` pull requests.
+
+        Args:
+            project_id (str): Project ID or name
+            status (Optional[str]): Filter by PR status ("active", "completed", "abandoned", or "all")
+            page_size (int): Pull requests requested per page. Defaults to 100.
+            prefetch (int): Pages fetched ahead of the consumer. Defaults to 4.
+
+        Yields:
+            Dict: Pull requests, in the order the API returns them
+        """
+
+        async def fetch_page(skip: int) -> List[Dict]:
+            endpoint, params = self._project_pull_requests_query(
+                project_id, status, page_size, skip
+            )
+            response = await self._async_client._make_request(
+                "GET", endpoint, params=params
+            )
+            return response.get("value", [])
+
+        pending = deque(
+            asyncio.create_task(fetch_page(page * page_size))
+            for page in range(max(1, prefetch))
+        )
+        next_skip = len(pending) * page_size
+        try:
+            while pending:
+                page = await pending.popleft()
+                for pr in page:
+                    yield pr
+                if len(page) < page_size:
+                    return
+                pending.append(asyncio.create_task(fetch_page(next_skip)))
+                next_skip += page_size
+        finally:
+            # Drop pages fetched past the end or abandoned by the consumer, and
+            # collect their outcomes so a failed page past the end (e.g. a 404)
+            # is not reported as a never-retrieved task exception
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def aget_pull_requests_by_ids(
+        self,
+        pull_request_ids: List[int],
+        include_commits: bool = False,
+        include_work_items: bool = False,
+    ) -> Dict[int, Dict]:
+        """
+        Asynchronously get details for several pull requests with asyncio.gather.
+
+        Args:
+            pull_request_ids (List[int]): IDs of the pull requests to retrieve
+            include_commits (bool): If true, include the associated commits
+            include_work_items (bool): If true, include the associated work item references
+
+        Returns:
+            Dict[int, Dict]: Pull request details keyed by pull request ID
+        """
+        unique_ids = list(dict.fromkeys(pull_request_ids))
+        details = await asyncio.gather(
+            *(
+                self.aget_pull_request_details(
+                    pr_id, include_commits, include_work_items
+                )
+                for pr_id in unique_ids
+            )
+        )
+        return dict(zip(unique_ids, details))
+
+    async def aget_pull_request_threads(
+        self,
+        repository_id: str,
+        pull_request_id: int,
+        project_id: Optional[str] = None,
+        include_comments: bool = True,
+        thread_id: Optional[int] = None,
+    ) -> Dict:
+        """
+        Asynchronously get comment threads for a pull request.
+
+        Args:
+            repository_id (str): ID of the repository
+            pull_request_id (int): ID of the pull request
+            project_id (Optional[str]): Project ID or name
+            include_comments (bool): Whether to include the comments in the threads
+            thread_id (Optional[int]): Specific thread ID to retrieve. If provided, only this thread is returned.
+
+        Returns:
+            Dict: Pull request comment threads
+        """
+        endpoint = _endpoint(
+            "thread" if thread_id else "threads",
+            project_id,
+            repo=repository_id,
+            pr=pull_request_id,
+            thread=thread_id,
+        )
+
+        params = {}
+        if include_comments:
+            params["$expand"] = "comments"
+
+        return await self._async_client._make_request(
+            "GET", endpoint, params=params, api_version="7.2-preview.1", coalesce=True
+        )
@@ -0,0 +1,106 @@
+"""
+Azure DevOps API Models
+
+This module provides lightweight typed views over the raw JSON returned by
+list endpoints, so downstream code can use attribute access instead of
+repeated dictionary lookups.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict
+
+
+def _strip_heads(ref_name: str) -> str:
+    """Turn 'refs/heads/main' into 'main'."""
+    return ref_name.removeprefix("refs/heads/")
+
+
+@dataclass(slots=True, frozen=True)
+class Branch:
+    """A Git branch ref."""
+
+    name: str
+    object_id: str
+    creator: str
+
+    @classmethod
+    def from_api(cls, value: Dict[str, Any]) -> "Branch":
+        """
+        Build a Branch from a refs API item.
+
+        Args:
+            value (Dict[str, Any]): Raw ref as returned by the API
+
+        Returns:
+            Branch: Typed view of the ref
+        """
+        return cls(
+            name=value.get("name", ""),
+            object_id=value.get("objectId", ""),
+            creator=(value.get("creator") or {}).get("displayName", ""),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class Commit:
+    """A Git commit summary."""
+
+    commit_id: str
+    author: str
+    author_date: str
+    comment: str
+
+    @classmethod
+    def from_api(cls, value: Dict[str, Any]) -> "Commit":
+        """
+        Build a Commit from a commits API item.
+
+        Args:
+            value (Dict[str, Any]): Raw commit as returned by the API
+
+        Returns:
+            Commit: Typed view of the commit
+        """
+        author = value.get("author") or {}
+        return cls(
+            commit_id=value.get("commitId", ""),
+            author=author.get("name", ""),
+            author_date=author.get("date", ""),
+            comment=value.get("comment", ""),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class PullRequest:
+    """A pull request summary."""
+
+    id: int
+    title: str
+    status: str
+    created_by: str
+    creation_date: str
+    source_branch: str
+    target_branch: str
+    repository_id: str
+
+    @classmethod
+    def from_api(cls, value: Dict[str, Any]) -> "PullRequest":
+        """
+        Build a PullRequest from a pull requests API item.
+
+        Args:
+            value (Dict[str, Any]): Raw pull request as returned by the API
+
+        Returns:
+            PullRequest: Typed view of the pull request
+        """
+        return cls(
+            id=value.get("pullRequestId", 0),
+            title=value.get("title", ""),
+            status=value.get("status", ""),
+            created_by=(value.get("createdBy") or {}).get("displayName", ""),
+            creation_date=value.get("creationDate", ""),
+            source_branch=_strip_heads(value.get("sourceRefName", "")),
+            target_branch=_strip_heads(value.get("targetRefName", "")),
+            repository_id=(value.get("repository") or {}).get("id", ""),
+        )
@@ -4,7 +4,7 @@ Projects Resource
 This module provides a specialized resource handler for Azure DevOps project operations.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 
 
 class ProjectsResource:
@@ -12,6 +12,8 @@ class ProjectsResource:
     Resource handler for Azure DevOps project operations.
     """
 
+    __slots__ = ("_client",)
+
     def __init__(self, base_client):
         """
         Initialize the Projects resource handler.
@@ -34,6 +36,27 @@ class ProjectsResource:
         Returns:
             List[Dict]: List of projects
         """
+        endpoint, params = self._all_query(state, top)
+        return self._client._list_pages(endpoint, params, cacheable=True)
+
+    def iter_all(
+        self, state: Optional[str] = None, top: Optional[int] = None
+    ) -> Iterator[Dict]:
+        """
+        Stream all projects in the organization page by page.
+
+        Args:
+            state (Optional[str]): Filter projects by state (wellFormed, createPending, etc.)
+            top (Optional[int]): Maximum number of projects to return
+
+        Returns:
+            Iterator[Dict]: Projects, fetched lazily across pages
+        """
+        endpoint, params = self._all_query(state, top)
+        return self._client._iter_pages(endpoint, params)
+
+    def _all_query(self, state: Optional[str], top: Optional[int]) -> Tuple[str, Dict]:
+        """Build the endpoint and query params for listing projects."""
         endpoint = "/_apis/projects"
 
         params = {}
@@ -42,8 +65,7 @@ class ProjectsResource:
         if top:
             params["$top"] = top
 
-        response = self._client._make_request("GET", endpoint, params=params)
-        return response.get("value", [])
+        return endpoint, params
 
     def get(self, project_id_or_name: str) -> Dict:
         """
@@ -56,7 +78,7 @@ class ProjectsResource:
             Dict: Project data
         """
         endpoint = f"/_apis/projects/{project_id_or_name}"
-        return self._client._make_request("GET", endpoint)
+        return self._client._make_request("GET", endpoint, cacheable=True)
 
     def get_team_members(
         self, project_id_or_name: str, team_id: Optional[str] = None
@@ -76,7 +98,7 @@ class ProjectsResource:
         else:
             endpoint = f"/_apis/projects/{project_id_or_name}/teams/default/members"
 
-        response = self._client._make_request("GET", endpoint)
+        response = self._client._make_request("GET", endpoint, cacheable=True)
         return response.get("value", [])
 
     def get_teams(self, project_id_or_name: str) -> List[Dict]:
@@ -91,5 +113,5 @@ class ProjectsResource:
         """
         endpoint = f"/_apis/projects/{project_id_or_name}/teams"
 
-        response = self._client._make_request("GET", endpoint)
+        response = self._client._make_request("GET", endpoint, cacheable=True)
         return response.get("value", [])
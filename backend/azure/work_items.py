@@ -4,7 +4,45 @@ Work Items Resource
 This module provides a specialized resource handler for Azure DevOps work item operations.
 """
 
-from typing import Dict, List, Any, Optional
+import asyncio
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+
+# The work items endpoint accepts at most this many IDs per request
+MAX_BATCH_SIZE = 200
+
+# Batch requests an async call keeps in flight at once, to stay clear of
+# Azure DevOps throttling
+ASYNC_CONCURRENCY = 16
+
+# Endpoint templates, kept in one table like the git resource's
+_ENDPOINTS = {
+    "work_item": "/_apis/wit/workitems/{id}",
+    "work_items": "/_apis/wit/workitems",
+    "project_work_item": "/{project}/_apis/wit/workitems/{id}",
+    "create_work_item": "/{project}/_apis/wit/workitems/${type}",
+    "work_items_batch": "/{project}/_apis/wit/workitemsbatch",
+    "batch": "/_apis/wit/$batch",
+    "wiql": "/{project}/_apis/wit/wiql",
+    "saved_wiql": "/{project}/_apis/wit/wiql/{query_id}",
+    "work_item_types": "/{project}/_apis/wit/workitemtypes",
+    "work_item_states": "/{project}/_apis/wit/workitemtypes/{type}/states",
+}
+
+
+def _endpoint(name: str, **parts: Any) -> str:
+    """
+    Build an endpoint from its template.
+
+    Args:
+        name (str): Key into the endpoint template table
+        **parts: Values for the template fields
+
+    Returns:
+        str: The endpoint path (without organization URL)
+    """
+    return _ENDPOINTS[name].format_map(parts)
 
 
 class WorkItemsResource:
@@ -12,14 +50,18 @@ class WorkItemsResource:
     Resource handler for Azure DevOps work item operations.
     """
 
-    def __init__(self, base_client):
+    __slots__ = ("_client", "_async_client")
+
+    def __init__(self, base_client, async_base_client=None):
         """
         Initialize the work items resource handler.
 
         Args:
             base_client: The base Azure client for making API requests
+            async_base_client: Optional async Azure client used by the ``a``-prefixed methods
         """
         self._client = base_client
+        self._async_client = async_base_client
 
     def get(self, work_item_id: int) -> Dict:
         """
@@ -31,7 +73,7 @@ class WorkItemsResource:
         Returns:
             Dict: Work item data
         """
-        endpoint = f"/_apis/wit/workitems/{work_item_id}"
+        endpoint = _endpoint("work_item", id=work_item_id)
         return self._client._make_request("GET", endpoint)
 
     def create(self, project: str, work_item_type: str, fields: Dict[str, Any]) -> Dict:
@@ -46,23 +88,25 @@ class WorkItemsResource:
         Returns:
             Dict: Created work item data
         """
-        endpoint = f"/{project}/_apis/wit/workitems/${work_item_type}"
-
-        # Format the fields as Azure DevOps API expects
-        operations = []
-        for field_name, field_value in fields.items():
-            operations.append(
-                {"op": "add", "path": f"/fields/{field_name}", "value": field_value}
-            )
+        endpoint = _endpoint("create_work_item", project=project, type=work_item_type)
 
         # Azure DevOps API requires application/json-patch+json content type for work item operations
         return self._client._make_request(
             "POST",
             endpoint,
-            data=operations,
+            data=orjson.dumps(self._field_operations(fields)),
             content_type="application/json-patch+json",
+            retry_server_errors=False,
         )
 
+    @staticmethod
+    def _field_operations(fields: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Format the fields of a new work item as the JSON patch the API expects."""
+        return [
+            {"op": "add", "path": f"/fields/{field_name}", "value": field_value}
+            for field_name, field_value in fields.items()
+        ]
+
     def update(
         self, work_item_id: int, project: str, updates: List[Dict[str, Any]]
     ) -> Dict:
@@ -81,14 +125,118 @@ class WorkItemsResource:
         Returns:
             Dict: Updated work item data
         """
-        endpoint = f"/{project}/_apis/wit/workitems/{work_item_id}"
+        endpoint = _endpoint("project_work_item", project=project, id=work_item_id)
         # Azure DevOps API requires application/json-patch+json content type for PATCH operations
         return self._client._make_request(
-            "PATCH", endpoint, data=updates, content_type="application/json-patch+json"
+            "PATCH",
+            endpoint,
+            data=orjson.dumps(updates),
+            content_type="application/json-patch+json",
         )
 
+    def batch_update(
+        self, project: str, updates_by_id: Dict[int, List[Dict[str, Any]]]
+    ) -> List[Dict]:
+        """
+        Update several work items with one $batch request per 200 items.
+
+        Args:
+            project (str): Project name or ID
+            updates_by_id (Dict[int, List[Dict[str, Any]]]): Update operations keyed by
+                work item ID, in the same format as ``update``
+
+        Returns:
+            List[Dict]: One result per update, in the order of updates_by_id: the
+                updated work item data, or {"error": ...} if that update failed
+        """
+        requests = [
+            {
+                "method": "PATCH",
+                "uri": _endpoint("project_work_item", project=project, id=work_item_id)
+                + "?api-version=6.0",
+                "headers": {"Content-Type": "application/json-patch+json"},
+                "body": updates,
+            }
+            for work_item_id, updates in updates_by_id.items()
+        ]
+        return self._send_batch(requests)
+
+    def batch_create(
+        self, project: str, work_items: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Dict]:
+        """
+        Create several work items with one $batch request per 200 items.
+
+        Creates are not idempotent, so the batches are only retried when throttled;
+        a 5xx or lost response is reported rather than resubmitted, as the server
+        may already have created the items.
+
+        Args:
+            project (str): Project name or ID
+            work_items (List[Tuple[str, Dict[str, Any]]]): (work_item_type, fields) pairs,
+                with fields in the same format as ``create``
+
+        Returns:
+            List[Dict]: One result per work item, in the order of work_items: the
+                created work item data, or {"error": ...} if it may not have been created
+        """
+        requests = [
+            {
+                "method": "PATCH",
+                "uri": _endpoint(
+                    "create_work_item", project=project, type=work_item_type
+                )
+                + "?api-version=6.0",
+                "headers": {"Content-Type": "application/json-patch+json"},
+                "body": self._field_operations(fields),
+            }
+            for work_item_type, fields in work_items
+        ]
+        return self._send_batch(requests, retry_server_errors=False)
+
+    def _send_batch(
+        self, requests: List[Dict[str, Any]], retry_server_errors: bool = True
+    ) -> List[Dict]:
+        """
+        Send sub-requests through $batch, MAX_BATCH_SIZE per call, and unwrap the results.
+
+        Failures are reported per sub-request instead of raised, so the results of
+        sub-requests that were already applied are never lost. When a whole $batch
+        call fails, each of its sub-requests is reported with that error.
+        """
+        results = []
+        for i in range(0, len(requests), MAX_BATCH_SIZE):
+            chunk = requests[i : i + MAX_BATCH_SIZE]
+            try:
+                response = self._client._make_request(
+                    "POST",
+                    _endpoint("batch"),
+                    data=chunk,
+                    retry_server_errors=retry_server_errors,
+                )
+            except Exception as e:
+                results.extend({"error": str(e)} for _ in chunk)
+                continue
+
+            # Each entry carries its own status code and a JSON-encoded body
+            for entry in response.get("value", []):
+                body = entry.get("body")
+                if not 200 <= entry.get("code", 0) < 300:
+                    error_message = (
+                        f"Request failed with status code {entry.get('code')}: {body}"
+                    )
+                    results.append({"error": error_message})
+                    continue
+                results.append(orjson.loads(body) if isinstance(body, str) else body)
+        return results
+
     def query(
-        self, project: str, query_text: str, top: Optional[int] = None
+        self,
+        project: str,
+        query_text: str,
+        top: Optional[int] = None,
+        page_size: int = MAX_BATCH_SIZE,
+        fields: Optional[List[str]] = None,
     ) -> List[Dict]:
         """
         Query work items using WIQL.
@@ -97,39 +245,214 @@ class WorkItemsResource:
             project (str): Project name or ID
             query_text (str): WIQL query text
             top (Optional[int], optional): Maximum number of items to return. Defaults to None.
+            page_size (int, optional): Work items fetched per request, capped at 200.
+                Defaults to 200.
+            fields (Optional[List[str]], optional): Fields to return for each work item,
+                e.g. ["System.Title", "System.State"]. Defaults to None (all fields).
 
         Returns:
             List[Dict]: List of work items matching the query
         """
-        endpoint = f"/{project}/_apis/wit/wiql"
+        endpoint, data, params = self._wiql_request(project, query_text, top)
+        response = self._client._make_request(
+            "POST", endpoint, data=data, params=params
+        )
 
-        data = {"query": query_text}
+        # The response contains work item references, not the full work items
+        # We need to get the full work items separately
+        return self._fetch_work_items(
+            project, self._work_item_ids(response), page_size, fields
+        )
 
-        params = {}
-        if top is not None:
-            params["$top"] = top
+    def query_by_id(
+        self,
+        project: str,
+        query_id: str,
+        top: Optional[int] = None,
+        page_size: int = MAX_BATCH_SIZE,
+        fields: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        Run a saved work item query, so the WIQL text is not sent on every call.
 
+        Args:
+            project (str): Project name or ID
+            query_id (str): ID of the saved query
+            top (Optional[int], optional): Maximum number of items to return. Defaults to None.
+            page_size (int, optional): Work items fetched per request, capped at 200.
+                Defaults to 200.
+            fields (Optional[List[str]], optional): Fields to return for each work item,
+                e.g. ["System.Title", "System.State"]. Defaults to None (all fields).
+
+        Returns:
+            List[Dict]: List of work items matching the query
+        """
+        endpoint = _endpoint("saved_wiql", project=project, query_id=query_id)
+        params = {"$top": top} if top is not None else None
+
+        response = self._client._make_request("GET", endpoint, params=params)
+        return self._fetch_work_items(
+            project, self._work_item_ids(response), page_size, fields
+        )
+
+    def get_many(
+        self,
+        project: str,
+        work_item_ids: List[int],
+        fields: Optional[List[str]] = None,
+    ) -> Dict[int, Dict]:
+        """
+        Get several work items by ID with one request per 200 IDs.
+
+        Args:
+            project (str): Project name or ID
+            work_item_ids (List[int]): IDs of the work items
+            fields (Optional[List[str]], optional): Fields to return for each work item.
+                Defaults to None (all fields).
+
+        Returns:
+            Dict[int, Dict]: Work item data keyed by ID; IDs that do not exist or
+                cannot be read are left out
+        """
+        unique_ids = list(dict.fromkeys(work_item_ids))
+        work_items = self._fetch_work_items(project, unique_ids, MAX_BATCH_SIZE, fields)
+        return {work_item["id"]: work_item for work_item in work_items}
+
+    def _fetch_work_items(
+        self,
+        project: str,
+        work_item_ids: List[int],
+        page_size: int,
+        fields: Optional[List[str]],
+    ) -> List[Dict]:
+        """Fetch work items by ID in batches the endpoint accepts, in parallel."""
+        if not work_item_ids:
+            return []
+
+        batches = list(self._batches(work_item_ids, page_size))
+        if len(batches) == 1:
+            return self._fetch_batch(project, fields, batches[0])
+
+        with ThreadPoolExecutor(max_workers=min(16, len(batches))) as executor:
+            return [
+                item
+                for batch in executor.map(
+                    lambda ids: self._fetch_batch(project, fields, ids), batches
+                )
+                for item in batch
+            ]
+
+    def _fetch_batch(
+        self, project: str, fields: Optional[List[str]], work_item_ids: List[int]
+    ) -> List[Dict]:
+        """Fetch one batch of work items by ID."""
+        method, endpoint, request = self._batch_request(project, fields, work_item_ids)
+        response = self._client._make_request(method, endpoint, **request)
+        # Deleted or inaccessible IDs come back as nulls (errorPolicy=omit)
+        return [item for item in response.get("value", []) if item]
+
+    def iter_query(
+        self,
+        project: str,
+        query_text: str,
+        top: Optional[int] = None,
+        page_size: int = MAX_BATCH_SIZE,
+        fields: Optional[List[str]] = None,
+    ) -> Iterator[Dict]:
+        """
+        Query work items using WIQL, yielding each work item as it is parsed.
+
+        Unlike query, batches are fetched one after another and streamed, so
+        only one work item is held in memory at a time.
+
+        Args:
+            project (str): Project name or ID
+            query_text (str): WIQL query text
+            top (Optional[int], optional): Maximum number of items to return. Defaults to None.
+            page_size (int, optional): Work items fetched per request, capped at 200.
+                Defaults to 200.
+            fields (Optional[List[str]], optional): Fields to return for each work item,
+                e.g. ["System.Title", "System.State"]. Defaults to None (all fields).
+
+        Yields:
+            Dict: Work items matching the query
+        """
+        endpoint, data, params = self._wiql_request(project, query_text, top)
         response = self._client._make_request(
             "POST", endpoint, data=data, params=params
         )
 
-        # The response contains work item references, not the full work items
-        # We need to get the full work items separately
-        work_item_refs = response.get("workItems", [])
+        for batch in self._batches(self._work_item_ids(response), page_size):
+            method, endpoint, request = self._batch_request(project, fields, batch)
+            for item in self._client._iter_json_items(method, endpoint, **request):
+                if item:
+                    yield item
 
-        if not work_item_refs:
+    def bulk_query(
+        self, queries: List[Tuple[str, str]], top: Optional[int] = None
+    ) -> List[List[Dict]]:
+        """
+        Run several WIQL queries concurrently.
+
+        Args:
+            queries (List[Tuple[str, str]]): (project, query_text) pairs to run
+            top (Optional[int], optional): Maximum number of items per query. Defaults to None.
+
+        Returns:
+            List[List[Dict]]: Work items for each query, in the order given
+        """
+        if not queries:
             return []
 
-        # Get the IDs of the work items
-        work_item_ids = [item["id"] for item in work_item_refs]
+        with ThreadPoolExecutor(max_workers=min(16, len(queries))) as executor:
+            return list(
+                executor.map(lambda query: self.query(query[0], query[1], top), queries)
+            )
+
+    @staticmethod
+    def _wiql_request(
+        project: str, query_text: str, top: Optional[int]
+    ) -> Tuple[str, Dict, Dict]:
+        """Build the endpoint, body and params of a WIQL query."""
+        params = {}
+        if top is not None:
+            params["$top"] = top
+
+        endpoint = _endpoint("wiql", project=project)
+        return endpoint, {"query": query_text}, params
+
+    @staticmethod
+    def _work_item_ids(response: Dict) -> List[int]:
+        """Extract the work item IDs from a WIQL response."""
+        return [item["id"] for item in response.get("workItems", [])]
+
+    @staticmethod
+    def _batches(work_item_ids: List[int], page_size: int) -> Iterator[List[int]]:
+        """Split work item IDs into batches of at most page_size IDs."""
+        page_size = max(1, min(page_size, MAX_BATCH_SIZE))
+        for i in range(0, len(work_item_ids), page_size):
+            yield work_item_ids[i : i + page_size]
+
+    @staticmethod
+    def _batch_request(
+        project: str, fields: Optional[List[str]], work_item_ids: List[int]
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Build the request that returns one batch of work items.
 
-        # Get the full work items
-        # Azure DevOps API allows getting multiple work items in a single request
-        ids_str = ",".join(map(str, work_item_ids))
-        endpoint = f"/_apis/wit/workitems?ids={ids_str}"
+        When fields are requested the workitemsbatch endpoint is used so only
+        those fields are sent back; otherwise full work items are fetched.
+        The last element holds the data/params keyword arguments for the request.
+        Missing IDs are omitted instead of failing the whole batch.
+        """
+        if fields:
+            body = {"ids": work_item_ids, "fields": fields, "errorPolicy": "omit"}
+            endpoint = _endpoint("work_items_batch", project=project)
+            return "POST", endpoint, {"data": body}
 
-        full_response = self._client._make_request("GET", endpoint)
-        return full_response.get("value", [])
+        # Pass the IDs as a query parameter so requests handles the encoding
+        params = {"ids": ",".join(map(str, work_item_ids)), "errorPolicy": "omit"}
+        return "GET", _endpoint("work_items"), {"params": params}
 
     def get_work_item_types(self, project: str) -> List[Dict]:
         """
@@ -141,8 +464,9 @@ class WorkItemsResource:
         Returns:
             List[Dict]: List of work item types
         """
-        endpoint = f"/{project}/_apis/wit/workitemtypes"
-        response = self._client._make_request("GET", endpoint)
+        endpoint = _endpoint("work_item_types", project=project)
+        # Process metadata rarely changes, so serve repeats from the response cache
+        response = self._client._make_request("GET", endpoint, cacheable=True)
         return response.get("value", [])
 
     def get_work_item_states(self, project: str, work_item_type: str) -> List[Dict]:
@@ -156,6 +480,173 @@ class WorkItemsResource:
         Returns:
             List[Dict]: List of work item states
         """
-        endpoint = f"/{project}/_apis/wit/workitemtypes/{work_item_type}/states"
-        response = self._client._make_request("GET", endpoint)
+        endpoint = _endpoint("work_item_states", project=project, type=work_item_type)
+        # Process metadata rarely changes, so serve repeats from the response cache
+        response = self._client._make_request("GET", endpoint, cacheable=True)
         return response.get("value", [])
+
+    # Async variants, meant to be fanned out with asyncio.gather
+
+    async def aget(self, work_item_id: int) -> Dict:
+        """
+        Asynchronously get a work item by ID.
+
+        Args:
+            work_item_id (int): ID of the work item
+
+        Returns:
+            Dict: Work item data
+        """
+        endpoint = _endpoint("work_item", id=work_item_id)
+        return await self._async_client._make_request("GET", endpoint, coalesce=True)
+
+    async def acreate(
+        self, project: str, work_item_type: str, fields: Dict[str, Any]
+    ) -> Dict:
+        """
+        Asynchronously create a new work item.
+
+        Args:
+            project (str): Project name or ID
+            work_item_type (str): Type of work item (Bug, Task, etc.)
+            fields (Dict[str, Any]): Fields to set on the work item
+
+        Returns:
+            Dict: Created work item data
+        """
+        endpoint = _endpoint("create_work_item", project=project, type=work_item_type)
+        return await self._async_client._make_request(
+            "POST",
+            endpoint,
+            data=orjson.dumps(self._field_operations(fields)),
+            content_type="application/json-patch+json",
+            retry_server_errors=False,
+        )
+
+    async def aupdate(
+        self, work_item_id: int, project: str, updates: List[Dict[str, Any]]
+    ) -> Dict:
+        """
+        Asynchronously update an existing work item.
+
+        Args:
+            work_item_id (int): ID of the work item to update
+            project (str): Project name or ID
+            updates (List[Dict[str, Any]]): List of JSON patch update operations
+
+        Returns:
+            Dict: Updated work item data
+        """
+        endpoint = _endpoint("project_work_item", project=project, id=work_item_id)
+        return await self._async_client._make_request(
+            "PATCH",
+            endpoint,
+            data=orjson.dumps(updates),
+            content_type="application/json-patch+json",
+        )
+
+    async def aquery(
+        self,
+        project: str,
+        query_text: str,
+        top: Optional[int] = None,
+        page_size: int = MAX_BATCH_SIZE,
+        fields: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        Asynchronously query work items using WIQL.
+
+        Args:
+            project (str): Project name or ID
+            query_text (str): WIQL query text
+            top (Optional[int], optional): Maximum number of items to return. Defaults to None.
+            page_size (int, optional): Work items fetched per request, capped at 200.
+                Defaults to 200.
+            fields (Optional[List[str]], optional): Fields to return for each work item,
+                e.g. ["System.Title", "System.State"]. Defaults to None (all fields).
+
+        Returns:
+            List[Dict]: List of work items matching the query
+        """
+        endpoint, data, params = self._wiql_request(project, query_text, top)
+        response = await self._async_client._make_request(
+            "POST", endpoint, data=data, params=params
+        )
+
+        return await self._afetch_work_items(
+            project, self._work_item_ids(response), page_size, fields
+        )
+
+    async def aget_many(
+        self,
+        project: str,
+        work_item_ids: List[int],
+        fields: Optional[List[str]] = None,
+    ) -> Dict[int, Dict]:
+        """
+        Asynchronously get several work items by ID with one request per 200 IDs.
+
+        Args:
+            project (str): Project name or ID
+            work_item_ids (List[int]): IDs of the work items
+            fields (Optional[List[str]], optional): Fields to return for each work item.
+                Defaults to None (all fields).
+
+        Returns:
+            Dict[int, Dict]: Work item data keyed by ID; IDs that do not exist or
+                cannot be read are left out
+        """
+        unique_ids = list(dict.fromkeys(work_item_ids))
+        work_items = await self._afetch_work_items(
+            project, unique_ids, MAX_BATCH_SIZE, fields
+        )
+        return {work_item["id"]: work_item for work_item in work_items}
+
+    async def _afetch_work_items(
+        self,
+        project: str,
+        work_item_ids: List[int],
+        page_size: int,
+        fields: Optional[List[str]],
+    ) -> List[Dict]:
+        """Fetch work items by ID in batches, at most ASYNC_CONCURRENCY at a time."""
+        if not work_item_ids:
+            return []
+
+        semaphore = asyncio.Semaphore(ASYNC_CONCURRENCY)
+
+        async def fetch(ids: List[int]) -> Dict:
+            method, endpoint, request = self._batch_request(project, fields, ids)
+            async with semaphore:
+                return await self._async_client._make_request(
+                    method, endpoint, **request
+                )
+
+        responses = await asyncio.gather(
+            *(fetch(batch) for batch in self._batches(work_item_ids, page_size))
+        )
+        return [
+            item for response in responses for item in response.get("value", []) if item
+        ]
+
+    async def abulk_query(
+        self, queries: List[Tuple[str, str]], top: Optional[int] = None
+    ) -> List[List[Dict]]:
+        """
+        Asynchronously run several WIQL queries with asyncio.gather.
+
+        Args:
+            queries (List[Tuple[str, str]]): (project, query_text) pairs to run
+            top (Optional[int], optional): Maximum number of items per query. Defaults to None.
+
+        Returns:
+            List[List[Dict]]: Work items for each query, in the order given
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.aquery(project, query_text, top)
+                    for project, query_text in queries
+                )
+            )
+        )
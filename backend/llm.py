@@ -0,0 +1,69 @@
+"""
+LLM Module
+
+This module provides the chat model and graph wiring shared by the PR agents.
+"""
+
+from functools import lru_cache
+from typing import Callable, List
+
+from langchain_core.messages import SystemMessage
+from langchain_core.runnables import RunnableLambda
+from langchain_openai import AzureChatOpenAI
+from langgraph.graph import START, StateGraph, MessagesState
+from langgraph.prebuilt import tools_condition, ToolNode
+
+from settings import get_azure_config, SHARED_HTTP_CLIENT, SHARED_ASYNC_HTTP_CLIENT
+
+
+@lru_cache(maxsize=1)
+def get_llm() -> AzureChatOpenAI:
+    """
+    Get the Azure OpenAI chat model, built once per process.
+
+    Returns:
+        AzureChatOpenAI: Chat model shared by every graph
+    """
+    azure_config = get_azure_config()
+    return AzureChatOpenAI(
+        model=azure_config["model"],
+        api_version=azure_config["api_version"],
+        azure_deployment=azure_config["azure_deployment"],
+        azure_endpoint=azure_config["azure_endpoint"],
+        openai_api_key=azure_config["openai_api_key"],
+        http_client=SHARED_HTTP_CLIENT,
+        http_async_client=SHARED_ASYNC_HTTP_CLIENT,
+    )
+
+
+def build_assistant_graph(tools: List[Callable], sys_msg: SystemMessage):
+    """
+    Build and compile an assistant/tools loop around the shared chat model.
+
+    Args:
+        tools (List[Callable]): Tools the assistant may call
+        sys_msg (SystemMessage): System prompt prepended to every turn
+
+    Returns:
+        CompiledStateGraph: Compiled graph ready to be invoked
+    """
+    llm_with_tools = get_llm().bind_tools(tools)
+
+    # Node, with an async path so the server can run many graphs on one event loop
+    def assistant(state: MessagesState):
+        return {"messages": [llm_with_tools.invoke((sys_msg, *state["messages"]))]}
+
+    async def aassistant(state: MessagesState):
+        response = await llm_with_tools.ainvoke((sys_msg, *state["messages"]))
+        return {"messages": [response]}
+
+    # Build graph
+    builder = StateGraph(MessagesState)
+    builder.add_node("assistant", RunnableLambda(assistant, afunc=aassistant))
+    builder.add_node("tools", ToolNode(tools))
+    builder.add_edge(START, "assistant")
+    builder.add_conditional_edges("assistant", tools_condition)
+    builder.add_edge("tools", "assistant")
+
+    # Compile graph; checkpointing is left to the LangGraph server
+    return builder.compile()
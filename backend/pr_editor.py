@@ -1,14 +1,11 @@
 from langchain_core.messages import SystemMessage
-from langgraph.graph import START, StateGraph, MessagesState
-from langgraph.prebuilt import tools_condition, ToolNode
 import sys
 import os
 
 # Add the parent directory to sys.path to enable relative imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from settings import AZURE_CONFIG
-from langchain_openai import AzureChatOpenAI
+from llm import build_assistant_graph
 from tools.git_repositories import (
     update_pull_request,
     get_pr_changes,
@@ -18,17 +15,6 @@ from tools.git_repositories import (
 # Define the tools
 tools = [get_pr_changes, update_pull_request, get_pull_request_details]
 
-# Initialize the LLM
-llm = AzureChatOpenAI(
-    model=AZURE_CONFIG["model"],
-    api_version=AZURE_CONFIG["api_version"],
-    azure_deployment=AZURE_CONFIG["azure_deployment"],
-    azure_endpoint=AZURE_CONFIG["azure_endpoint"],
-    openai_api_key=AZURE_CONFIG["openai_api_key"],
-)
-
-llm_with_tools = llm.bind_tools(tools)
-
 # System message
 sys_msg = SystemMessage(
     content="""You are an expert at writing professional pull requests, the PR must feel human and not like a robot.
@@ -71,18 +57,5 @@ when you are done updating the PR, the response you give to the user to explain
 )
 
 
-# Node
-def assistant(state: MessagesState):
-    return {"messages": [llm_with_tools.invoke([sys_msg] + state["messages"])]}
-
-
-# Build graph
-builder = StateGraph(MessagesState)
-builder.add_node("assistant", assistant)
-builder.add_node("tools", ToolNode(tools))
-builder.add_edge(START, "assistant")
-builder.add_conditional_edges("assistant", tools_condition)
-builder.add_edge("tools", "assistant")
-
-# Compile graph
-graph = builder.compile()
+# Build and compile graph
+graph = build_assistant_graph(tools, sys_msg)
@@ -1,8 +1,5 @@
 from langchain_core.messages import SystemMessage
 
-from langgraph.graph import START, StateGraph, MessagesState
-from langgraph.prebuilt import tools_condition, ToolNode
-
 import sys
 import os
 
@@ -10,6 +7,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+from llm import build_assistant_graph
 from tools.git_repositories import (
     get_pr_changes,
     get_pull_request_details,
@@ -28,22 +26,6 @@ tools = [
     update_pull_request_comment,
 ]
 
-# Define LLM with bound tools
-from langchain_openai import AzureChatOpenAI
-
-from settings import AZURE_CONFIG
-
-# Initialize the LLM
-llm = AzureChatOpenAI(
-    model=AZURE_CONFIG["model"],
-    api_version=AZURE_CONFIG["api_version"],
-    azure_deployment=AZURE_CONFIG["azure_deployment"],
-    azure_endpoint=AZURE_CONFIG["azure_endpoint"],
-    openai_api_key=AZURE_CONFIG["openai_api_key"],
-)
-
-llm_with_tools = llm.bind_tools(tools)
-
 # System message
 sys_msg = SystemMessage(
     content="""You are a senior software engineer responsible for conducting thorough code reviews on Azure DevOps pull requests.
@@ -88,20 +70,5 @@ If the user asks for updating a comment, use update_pull_request_comment to upda
 )
 
 
-def assistant(state: MessagesState):
-    return {"messages": [llm_with_tools.invoke([sys_msg] + state["messages"])]}
-
-
-# Build graph
-builder = StateGraph(MessagesState)
-builder.add_node("assistant", assistant)
-builder.add_node("tools", ToolNode(tools))
-builder.add_edge(START, "assistant")
-builder.add_conditional_edges(
-    "assistant",
-    tools_condition,
-)
-builder.add_edge("tools", "assistant")
-
-# Compile graph
-graph = builder.compile()
+# Build and compile graph
+graph = build_assistant_graph(tools, sys_msg)
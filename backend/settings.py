@@ -1,15 +1,42 @@
 import os
+from functools import lru_cache
+from typing import Dict, Optional
+
 import dotenv
+import httpx
 
 dotenv.load_dotenv()
 
 organization_url = os.getenv("AZURE_ORGANIZATION_URL")
 personal_access_token = os.getenv("AZURE_PERSONAL_ACCESS_TOKEN")
+pool_size = int(os.getenv("AZDO_POOL_SIZE", "32"))
+
+
+@lru_cache(maxsize=1)
+def get_azure_config() -> Dict[str, Optional[str]]:
+    """
+    Read the Azure OpenAI settings on first use.
+
+    The settings are read once per process: the chat model built from them by
+    llm.get_llm is cached too and bound into the graphs at import, so changing
+    the environment takes effect only after a restart.
+
+    Returns:
+        Dict[str, Optional[str]]: Keyword arguments for AzureChatOpenAI
+    """
+    return {
+        "api_version": os.environ.get("AZURE_API_VERSION"),
+        "azure_endpoint": os.environ.get("AZURE_ENDPOINT"),
+        "azure_deployment": os.environ.get("AZURE_DEPLOYMENT"),
+        "model": os.environ.get("AZURE_MODEL"),
+        "openai_api_key": os.environ.get("AZURE_API_KEY"),
+    }
+
 
-AZURE_CONFIG = {
-    "api_version": os.getenv("AZURE_API_VERSION"),
-    "azure_endpoint": os.getenv("AZURE_ENDPOINT"),
-    "azure_deployment": os.getenv("AZURE_DEPLOYMENT"),
-    "model": os.getenv("AZURE_MODEL"),
-    "openai_api_key": os.getenv("AZURE_API_KEY"),
-}
+# One connection pool per process for all LLM calls, so the PR graphs reuse
+# keep-alive connections instead of each opening their own
+_LLM_HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+SHARED_HTTP_CLIENT = httpx.Client(limits=_LLM_HTTP_LIMITS, timeout=httpx.Timeout(60.0))
+SHARED_ASYNC_HTTP_CLIENT = httpx.AsyncClient(
+    limits=_LLM_HTTP_LIMITS, timeout=httpx.Timeout(60.0)
+)
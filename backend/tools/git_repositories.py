@@ -5,17 +5,140 @@ This module provides functions for working with Azure DevOps Git repositories.
 It uses the AzureDevOpsClient for all API interactions.
 """
 
-import sys
-import os
-import difflib
+import atexit
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import methodcaller
 from typing import Optional, List, Dict, Any
 
-# Add the parent directory to sys.path to allow relative imports
-sys.path.append(
-    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-)
+from cachetools import LRUCache
+
+# Prefer the C implementation of SequenceMatcher; it has the same API
+try:
+    from cdifflib import CSequenceMatcher as SequenceMatcher
+except ImportError:
+    from difflib import SequenceMatcher
+
 from backend.azure.client import AzureDevOpsClient
 
+logger = logging.getLogger(__name__)
+
+# Files left out of PR change analysis as they say little about the change
+_SKIPPED_EXTENSIONS = (".lock", ".pyc", ".svg", ".ico", ".woff", ".ttf")
+
+# Guards for generate_git_style_diff: files larger than MAX_DIFF_CHARS are not
+# diffed at all, and a changed region longer than MAX_DIFF_LINES on either side
+# is shown as a block replacement instead of being run through the matcher
+MAX_DIFF_CHARS = 1_000_000
+MAX_DIFF_LINES = 5000
+_BINARY_SNIFF_SIZE = 8192
+
+# Diff row layouts; %-formatting is ~30% faster than f-strings with
+# width specs on these hot per-line paths
+_EQUAL_ROW = "%4d %4d  %s"
+_REMOVED_ROW = "%4d      - %s"
+_ADDED_ROW = "     %4d + %s"
+_NEW_FILE_ROW = "%4d +%s"
+
+# Work item fields shown in pull request details
+_WORK_ITEM_DETAIL_FIELDS = [
+    "System.Title",
+    "System.WorkItemType",
+    "System.State",
+    "System.Description",
+    "System.AssignedTo",
+    "Microsoft.VSTS.Common.AcceptanceCriteria",
+    "Microsoft.VSTS.TCM.ReproSteps",
+]
+
+# Extractors for the LLM-friendly pull request views, keyed by output field
+_PR_EXTRACTORS = {
+    "id": methodcaller("get", "pullRequestId"),
+    "title": methodcaller("get", "title"),
+    "description": methodcaller("get", "description"),
+    "status": methodcaller("get", "status"),
+    "created_by": lambda pr: pr.get("createdBy", {}).get("displayName"),
+    "creation_date": methodcaller("get", "creationDate"),
+    "source_branch": lambda pr: pr.get("sourceRefName", "").removeprefix("refs/heads/"),
+    "target_branch": lambda pr: pr.get("targetRefName", "").removeprefix("refs/heads/"),
+    "repository": lambda pr: {
+        "id": pr.get("repository", {}).get("id"),
+        "name": pr.get("repository", {}).get("name"),
+    },
+    "merge_status": methodcaller("get", "mergeStatus"),
+    "url": methodcaller("get", "url"),
+    "is_auto_complete": lambda pr: pr.get("autoCompleteSetBy") is not None,
+}
+
+
+def _pr_fields(*keys: str) -> tuple:
+    """Resolve output field names to (field, extractor) pairs once, at import."""
+    return tuple((key, _PR_EXTRACTORS[key]) for key in keys)
+
+
+_PR_DETAIL_FIELDS = _pr_fields(
+    "id",
+    "title",
+    "description",
+    "created_by",
+    "source_branch",
+    "target_branch",
+    "repository",
+)
+_PR_LIST_FIELDS = _pr_fields(
+    "id",
+    "title",
+    "description",
+    "status",
+    "created_by",
+    "creation_date",
+    "source_branch",
+    "target_branch",
+    "repository",
+    "url",
+)
+_PR_UPDATE_FIELDS = _pr_fields(
+    "id",
+    "title",
+    "description",
+    "status",
+    "source_branch",
+    "target_branch",
+    "created_by",
+    "merge_status",
+    "url",
+    "is_auto_complete",
+)
+
+# Blob bytes by (repository_id, objectId), bounded by total size. Blobs are
+# fetched by object id, so an entry always holds exactly the content its id
+# names and never goes stale; repeated PR analyses skip refetching
+_BLOB_CACHE_BYTES = 64 * 1024 * 1024
+_blob_cache = LRUCache(maxsize=_BLOB_CACHE_BYTES, getsizeof=len)
+_blob_cache_lock = threading.Lock()
+
+# One client per process so every tool call reuses the same connection pool
+_client: Optional[AzureDevOpsClient] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> AzureDevOpsClient:
+    """
+    Get the shared Azure DevOps client, creating it on first use.
+
+    Returns:
+        AzureDevOpsClient: The process-wide client
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = AzureDevOpsClient()
+                atexit.register(_client.close)
+    return _client
+
 
 def get_repositories(project: Optional[str] = None) -> List[Dict]:
     """
@@ -28,11 +151,11 @@ def get_repositories(project: Optional[str] = None) -> List[Dict]:
         List of repositories or None if the request fails
     """
     try:
-        client = AzureDevOpsClient()
+        client = _get_client()
         response = client.git.get_repositories(project)
         return response
-    except Exception as e:
-        print(f"Error retrieving repositories: {str(e)}")
+    except Exception:
+        logger.exception("Error retrieving repositories")
         return None
 
 
@@ -47,14 +170,114 @@ def get_repository(repository_id: str) -> Optional[Dict]:
         Dict: Repository data or None if the request fails
     """
     try:
-        client = AzureDevOpsClient()
-        endpoint = f"/_apis/git/repositories/{repository_id}"
-        return client._make_request("GET", endpoint)
-    except Exception as e:
-        print(f"Error retrieving repository {repository_id}: {str(e)}")
+        client = _get_client()
+        return client.git.get_repository(repository_id)
+    except Exception:
+        logger.exception("Error retrieving repository %s", repository_id)
         return None
 
 
+def get_repository_branches(repository_id: str) -> List[Dict]:
+    """
+    Get the branches of a Git repository.
+
+    Args:
+        repository_id (str): ID of the repository
+
+    Returns:
+        List[Dict]: Branch refs, or an empty list if the request fails
+    """
+    try:
+        client = _get_client()
+        return client.git.get_branches(repository_id)
+    except Exception:
+        logger.exception("Error retrieving branches of repository %s", repository_id)
+        return []
+
+
+def _diff_opcodes(previous_lines: List[str], current_lines: List[str]):
+    """
+    Yield SequenceMatcher opcodes, running the matcher only on the changed middle.
+
+    The common prefix and suffix are emitted as "equal" blocks directly, so
+    unchanged files and the untouched head and tail of edited files never
+    reach the (quadratic) matcher; neither do pure additions or removals.
+
+    Args:
+        previous_lines: Lines of the file before changes
+        current_lines: Lines of the file after changes
+
+    Yields:
+        Tuples of (tag, i1, i2, j1, j2) as returned by SequenceMatcher.get_opcodes
+    """
+    previous_len, current_len = len(previous_lines), len(current_lines)
+    shortest = min(previous_len, current_len)
+
+    prefix = 0
+    while prefix < shortest and previous_lines[prefix] == current_lines[prefix]:
+        prefix += 1
+
+    suffix = 0
+    while (
+        suffix < shortest - prefix
+        and previous_lines[previous_len - suffix - 1]
+        == current_lines[current_len - suffix - 1]
+    ):
+        suffix += 1
+
+    if prefix:
+        yield "equal", 0, prefix, 0, prefix
+
+    previous_end, current_end = previous_len - suffix, current_len - suffix
+    if prefix == previous_end and prefix < current_end:
+        # Pure addition (e.g. lines appended or a file that was empty before)
+        yield "insert", prefix, prefix, prefix, current_end
+    elif prefix == current_end and prefix < previous_end:
+        # Pure removal (e.g. lines dropped or a file emptied)
+        yield "delete", prefix, previous_end, prefix, prefix
+    elif max(previous_end, current_end) - prefix > MAX_DIFF_LINES:
+        # Too large for the quadratic matcher; show the region as replaced
+        yield "replace", prefix, previous_end, prefix, current_end
+    elif prefix < previous_end:
+        previous_middle = previous_lines[prefix:previous_end]
+        current_middle = current_lines[prefix:current_end]
+
+        # The matcher indexes seq2 once and scans seq1 against it, so it is
+        # markedly faster with the longer side as seq2; the blocks are flipped
+        # back below when the sides were swapped. autojunk is off so both
+        # implementations produce the same blocks.
+        swapped = len(previous_middle) > len(current_middle)
+        if swapped:
+            matcher = SequenceMatcher(
+                None, current_middle, previous_middle, autojunk=False
+            )
+        else:
+            matcher = SequenceMatcher(
+                None, previous_middle, current_middle, autojunk=False
+            )
+
+        # Derive the opcodes straight from the matching blocks instead of
+        # having get_opcodes() build an intermediate list from them
+        i = j = prefix
+        for a, b, size in matcher.get_matching_blocks():
+            if swapped:
+                a, b = b, a
+            a += prefix
+            b += prefix
+            if i < a and j < b:
+                yield "replace", i, a, j, b
+            elif i < a:
+                yield "delete", i, a, j, j
+            elif j < b:
+                yield "insert", i, i, j, b
+            if size:
+                yield "equal", a, a + size, b, b + size
+            i, j = a + size, b + size
+
+    if suffix:
+        yield "equal", previous_end, previous_len, current_end, current_len
+
+
 def generate_git_style_diff(previous_content: str, current_content: str) -> str:
     """
     Generate a git-style diff with line numbers from two versions of file content.
@@ -73,54 +296,160 @@ def generate_git_style_diff(previous_content: str, current_content: str) -> str:
     if not isinstance(current_content, str):
         current_content = str(current_content)
 
+    # Skip binary and oversized (typically generated or minified) files
+    if (
+        "\x00" in previous_content[:_BINARY_SNIFF_SIZE]
+        or "\x00" in current_content[:_BINARY_SNIFF_SIZE]
+    ):
+        return "[diff skipped: binary content]"
+    if max(len(previous_content), len(current_content)) > MAX_DIFF_CHARS:
+        return f"[diff skipped: file exceeds {MAX_DIFF_CHARS} characters]"
+
     # Split content into lines
     previous_lines = previous_content.splitlines()
     current_lines = current_content.splitlines()
 
-    # Use SequenceMatcher to identify matching and differing blocks
-    matcher = difflib.SequenceMatcher(None, previous_lines, current_lines)
-
     # Build the complete diff including all lines
     formatted_diff = []
     old_line_num = 1
     new_line_num = 1
 
     # Process each operation from the matcher
-    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+    for op, i1, i2, j1, j2 in _diff_opcodes(previous_lines, current_lines):
         if op == "equal":
             # Unchanged lines - include all of them
-            for i, line in enumerate(previous_lines[i1:i2]):
-                formatted_diff.append(
-                    f"{old_line_num + i:4d} {new_line_num + i:4d}  {line}"
+            formatted_diff.extend(
+                _EQUAL_ROW % (old_num, new_num, line)
+                for old_num, new_num, line in zip(
+                    range(old_line_num, old_line_num + i2 - i1),
+                    range(new_line_num, new_line_num + j2 - j1),
+                    previous_lines[i1:i2],
                 )
+            )
             old_line_num += i2 - i1
             new_line_num += j2 - j1
 
         elif op == "delete":
             # Lines removed - show with '-' prefix
-            for i, line in enumerate(previous_lines[i1:i2]):
-                formatted_diff.append(f"{old_line_num + i:4d}      - {line}")
+            formatted_diff.extend(
+                _REMOVED_ROW % (num, line)
+                for num, line in enumerate(previous_lines[i1:i2], old_line_num)
+            )
             old_line_num += i2 - i1
 
         elif op == "insert":
             # Lines added - show with '+' prefix
-            for i, line in enumerate(current_lines[j1:j2]):
-                formatted_diff.append(f"     {new_line_num + i:4d} + {line}")
+            formatted_diff.extend(
+                _ADDED_ROW % (num, line)
+                for num, line in enumerate(current_lines[j1:j2], new_line_num)
+            )
             new_line_num += j2 - j1
 
         elif op == "replace":
             # Lines replaced - show both old and new versions
-            for i, line in enumerate(previous_lines[i1:i2]):
-                formatted_diff.append(f"{old_line_num + i:4d}      - {line}")
+            formatted_diff.extend(
+                _REMOVED_ROW % (num, line)
+                for num, line in enumerate(previous_lines[i1:i2], old_line_num)
+            )
             old_line_num += i2 - i1
 
-            for i, line in enumerate(current_lines[j1:j2]):
-                formatted_diff.append(f"     {new_line_num + i:4d} + {line}")
+            formatted_diff.extend(
+                _ADDED_ROW % (num, line)
+                for num, line in enumerate(current_lines[j1:j2], new_line_num)
+            )
             new_line_num += j2 - j1
 
     return "\n".join(formatted_diff)
 
 
+def _to_text(content: Any) -> Any:
+    """
+    Decode raw file bytes as UTF-8 text, replacing undecodable bytes.
+
+    Content with a NUL byte near the start is treated as binary and replaced by a
+    placeholder. Anything that is not bytes is returned unchanged.
+
+    Args:
+        content: File content as returned by get_file_content
+
+    Returns:
+        The decoded text, a binary placeholder, or the content unchanged
+    """
+    if not isinstance(content, (bytes, bytearray)):
+        return content
+    if b"\x00" in content[:_BINARY_SNIFF_SIZE]:
+        return f"[Binary content - {len(content)} bytes]"
+    return content.decode("utf-8", errors="replace")
+
+
+def _fetch_file_contents(
+    client: AzureDevOpsClient, repository_id: str, fetches: List[tuple]
+) -> Dict[tuple, Any]:
+    """
+    Fetch several file versions concurrently.
+
+    Versions with a known Git object id are fetched by that id and served from,
+    and added to, the process-wide blob cache; the others are fetched from the
+    branch head.
+
+    Args:
+        client: Azure DevOps client to fetch with
+        repository_id: ID of the Git repository
+        fetches: (side, branch, file_path, object_id) tuples to fetch, where side
+            labels the version ("source" or "base"), branch is the fallback ref,
+            paths have no leading slash and object_id may be None when the API
+            did not report one
+
+    Returns:
+        Dictionary mapping each (side, file_path) pair to its content, or to the
+        exception raised while fetching it
+    """
+
+    def fetch(key):
+        _, branch, file_path, object_id = key
+        try:
+            if not object_id:
+                return client.git.get_file_content(repository_id, branch, file_path)
+
+            cache_key = (repository_id, object_id)
+            with _blob_cache_lock:
+                content = _blob_cache.get(cache_key)
+            if content is None:
+                content = client.git.get_blob_content(repository_id, object_id)
+                # Oversized blobs are never diffed, so don't let them evict others
+                if len(content) <= MAX_DIFF_CHARS:
+                    with _blob_cache_lock:
+                        _blob_cache[cache_key] = content
+            return content
+        except Exception as e:
+            return e
+
+    if not fetches:
+        return {}
+
+    keys = [(side, file_path) for side, _, file_path, _ in fetches]
+    with ThreadPoolExecutor(max_workers=min(16, len(fetches))) as executor:
+        return dict(zip(keys, executor.map(fetch, fetches)))
+
+
+def _fetched(contents: Dict[tuple, Any], side: str, file_path: str) -> Any:
+    """
+    Look up a prefetched file version, re-raising its fetch error if it failed.
+
+    Args:
+        contents: Result of _fetch_file_contents
+        side: Version label the file was fetched under ("source" or "base")
+        file_path: Path of the file
+
+    Returns:
+        The file content
+    """
+    content = contents[(side, file_path)]
+    if isinstance(content, Exception):
+        raise content
+    return content
+
+
 def get_pr_changes(
     repository_id: str,
     source_branch: str,
@@ -142,10 +471,12 @@ def get_pr_changes(
     Returns:
         Dictionary with structured information about the changes, including:
         - summary statistics (number of files changed, types of changes)
-        - file changes with their content (before and after for modifications)
+        - file changes with their content (before and after for modifications); the
+          "before" side of an edit is the merge-base version the diff was computed
+          against, not necessarily the current head of the target branch
     """
     try:
-        client = AzureDevOpsClient()
+        client = _get_client()
 
         # Get the diff between branches
         raw_diff = client.git.get_branch_diff(
@@ -153,114 +484,80 @@ def get_pr_changes(
         )
 
         # Filter out folder changes
-        diff = raw_diff.copy()
-        filtered_changes = [
+        changes = [
             change
             for change in raw_diff.get("changes", [])
             if not change.get("item", {}).get("isFolder", False)
         ]
-        diff["changes"] = filtered_changes
 
         # Recalculate change counts
         change_counts = {}
-        for change in filtered_changes:
+        for change in changes:
             change_type = change.get("changeType", "").capitalize()
             change_counts[change_type] = change_counts.get(change_type, 0) + 1
 
-        diff["changeCounts"] = change_counts
-
         # Extract basic information
         result = {
             "summary": {
-                "total_files_changed": sum(diff.get("changeCounts", {}).values()),
-                "change_types": diff.get("changeCounts", {}),
+                "total_files_changed": len(changes),
+                "change_types": change_counts,
             },
             "files": [],
         }
 
-        # Get detailed file changes (limit to max_files)
-        changes = diff.get("changes", [])
-        file_count = 0
-
-        for change in changes:
-            if file_count >= max_files:
-                break
-
-            item = change.get("item", {})
-            change_type = change.get("changeType", "").lower()
-
-            # Skip folders, only process files
-            if item.get("isFolder", False):
-                continue
-
-            file_path = item.get("path", "")
+        # Get detailed file changes (limit to max_files), skipping files that
+        # would be less useful for PR description; islice stops the scan as
+        # soon as enough files are found
+        candidates = (
+            change
+            for change in changes
+            if not change.get("item", {}).get("path", "").endswith(_SKIPPED_EXTENSIONS)
+        )
+        selected = [
+            (
+                change.get("changeType", "").lower(),
+                change.get("item", {}).get("path", ""),
+                change.get("item", {}),
+            )
+            for change in islice(candidates, max_files)
+        ]
 
-            # Skip certain files that would be less useful for PR description
-            if file_path.endswith((".lock", ".pyc", ".svg", ".ico", ".woff", ".ttf")):
-                continue
+        # Fetch every needed file version up front, in parallel; objectId and
+        # originalObjectId name the exact source and merge-base blobs the diff
+        # compared, so those are fetched (and cached) by id. The base side falls
+        # back to the target branch head only when no object id was reported
+        fetches = []
+        for change_type, file_path, item in selected:
+            clean_path = file_path.lstrip("/")
+            if change_type in ("edit", "add"):
+                fetches.append(
+                    ("source", source_branch, clean_path, item.get("objectId"))
+                )
+            if change_type == "edit":
+                fetches.append(
+                    ("base", target_branch, clean_path, item.get("originalObjectId"))
+                )
+        contents = _fetch_file_contents(client, repository_id, fetches)
 
+        for change_type, file_path, _ in selected:
+            clean_path = file_path.lstrip("/")
             file_info = {
                 "path": file_path,
                 "change_type": change_type,
             }
 
-            # Check if file is a package-related file
-            is_package_file = any(
-                [
-                    file_path.endswith(
-                        (
-                            "package.json",
-                            "package-lock.json",
-                            "requirements.txt",
-                            "Pipfile",
-                            "Pipfile.lock",
-                            "poetry.lock",
-                            "yarn.lock",
-                            "composer.json",
-                            "composer.lock",
-                            "Gemfile",
-                            "Gemfile.lock",
-                        )
-                    ),
-                    "package" in file_path.lower(),
-                    "dependencies" in file_path.lower(),
-                    "requirements" in file_path.lower(),
-                ]
-            )
-
             # If it's a file modification, get both versions
             if change_type == "edit":
                 try:
                     # Get current version from source branch
-                    current_content = client.git.get_file_content(
-                        repository_id, source_branch, file_path.lstrip("/")
-                    )
+                    current_content = _fetched(contents, "source", clean_path)
 
-                    # Get previous version from target branch
-                    previous_content = client.git.get_file_content(
-                        repository_id, target_branch, file_path.lstrip("/")
-                    )
+                    # Get previous version at the merge base with the target branch
+                    previous_content = _fetched(contents, "base", clean_path)
 
                     # Convert to string if needed
-                    if not isinstance(current_content, str) and hasattr(
-                        current_content, "decode"
-                    ):
-                        try:
-                            current_content = current_content.decode("utf-8")
-                        except UnicodeDecodeError:
-                            current_content = (
-                                f"[Binary content - {len(current_content)} bytes]"
-                            )
-
-                    if not isinstance(previous_content, str) and hasattr(
-                        previous_content, "decode"
-                    ):
-                        try:
-                            previous_content = previous_content.decode("utf-8")
-                        except UnicodeDecodeError:
-                            previous_content = (
-                                f"[Binary content - {len(previous_content)} bytes]"
-                            )
+                    current_content = _to_text(current_content)
+                    previous_content = _to_text(previous_content)
 
                     # Generate git-style diff with line numbers
                     file_info["diff"] = generate_git_style_diff(
@@ -274,16 +571,10 @@ def get_pr_changes(
             # For new files, just get the new content
             elif change_type == "add":
                 try:
-                    content = client.git.get_file_content(
-                        repository_id, source_branch, file_path.lstrip("/")
-                    )
+                    content = _fetched(contents, "source", clean_path)
 
                     # Convert to string if needed
-                    if not isinstance(content, str) and hasattr(content, "decode"):
-                        try:
-                            content = content.decode("utf-8")
-                        except UnicodeDecodeError:
-                            content = f"[Binary content - {len(content)} bytes]"
+                    content = _to_text(content)
 
                     # For new files, the diff is just the whole file with + prefixes
                     file_lines = (
@@ -292,8 +583,10 @@ def get_pr_changes(
                         else str(content).splitlines()
                     )
                     diff_lines = ["@@ -0,0 +1,{} @@".format(len(file_lines))]
-                    for i, line in enumerate(file_lines, 1):
-                        diff_lines.append(f"{i:4d} +{line}")
+                    diff_lines.extend(
+                        _NEW_FILE_ROW % (i, line)
+                        for i, line in enumerate(file_lines, 1)
+                    )
                     file_info["diff"] = "\n".join(diff_lines)
 
                 except Exception as e:
@@ -301,17 +594,16 @@ def get_pr_changes(
 
             # Add the file info to our results
             result["files"].append(file_info)
-            file_count += 1
 
         # Add a note if we hit the file limit
-        if file_count >= max_files and len(changes) > max_files:
+        if len(selected) >= max_files and len(changes) > max_files:
             result["summary"][
                 "note"
             ] = f"Only showing {max_files} of {len(changes)} changed files."
 
         return result
     except Exception as e:
-        print(f"Error retrieving PR changes: {str(e)}")
+        logger.exception("Error retrieving PR changes")
         return {"error": str(e)}
 
 
@@ -340,7 +632,7 @@ def get_pull_request_comments(
         - general_comments: Comments not attached to specific files
     """
     try:
-        client = AzureDevOpsClient()
+        client = _get_client()
 
         # Get the comment threads
         thread_data = client.git.get_pull_request_threads(
@@ -385,19 +677,18 @@ def get_pull_request_comments(
             result["threads"].append(thread_info)
 
             # Check if this is a file comment
-            file_path = thread.get("threadContext", {}).get("filePath")
+            thread_context = thread.get("threadContext") or {}
+            file_path = thread_context.get("filePath")
             if file_path:
                 if file_path not in result["file_comments"]:
                     result["file_comments"][file_path] = []
 
                 # Add position information if available
-                file_comment = dict(thread_info)  # Copy the thread info
-                if "rightFileStart" in thread.get("threadContext", {}):
-                    file_comment["line"] = (
-                        thread.get("threadContext", {})
-                        .get("rightFileStart", {})
-                        .get("line")
-                    )
+                right_file_start = thread_context.get("rightFileStart")
+                if right_file_start is not None:
+                    file_comment = {**thread_info, "line": right_file_start.get("line")}
+                else:
+                    file_comment = thread_info
 
                 result["file_comments"][file_path].append(file_comment)
             else:
@@ -407,7 +698,7 @@ def get_pull_request_comments(
         return result
 
     except Exception as e:
-        print(f"Error retrieving pull request comments: {str(e)}")
+        logger.exception("Error retrieving pull request comments")
         return {"error": str(e)}
 
 
@@ -442,7 +733,7 @@ def add_pull_request_comment(
         Dict with information about the created comment thread including its ID and status
     """
     try:
-        client = AzureDevOpsClient()
+        client = _get_client()
 
         # Set up file positions if commenting on a specific line
         right_file_start = None
@@ -472,7 +763,7 @@ def add_pull_request_comment(
         # Format the response in a more LLM-friendly way
         if not thread:
             return {"error": "Failed to create comment thread"}
-        print(thread)
+        logger.debug("Created thread: %s", thread)
 
         result = {
             "thread_id": thread.get("id"),
@@ -497,11 +788,11 @@ def add_pull_request_comment(
             if right_file_start is not None:
                 result["line_number"] = right_file_start.get("line")
 
-        print(result)
+        logger.debug("Comment result: %s", result)
         return result
 
     except Exception as e:
-        print(f"Error adding pull request comment: {str(e)}")
+        logger.exception("Error adding pull request comment")
         return {"error": str(e)}
 
 
@@ -524,7 +815,7 @@ def delete_pull_request_comment(
         A dictionary indicating success or containing error information
     """
     try:
-        client = AzureDevOpsClient()
+        client = _get_client()
 
         # Delete the comment using the Git resource handler
         response = client.git.delete_pull_request_comment(
@@ -541,7 +832,7 @@ def delete_pull_request_comment(
         }
 
     except Exception as e:
-        print(f"Error deleting pull request comment: {str(e)}")
+        logger.exception("Error deleting pull request comment")
         return {"success": False, "error": str(e)}
 
 
@@ -569,7 +860,7 @@ def update_pull_request_comment(
         A dictionary containing the updated comment information or error details
     """
     try:
-        client = AzureDevOpsClient()
+        client = _get_client()
 
         # Update the comment using the Git resource handler
         response = client.git.update_pull_request_comment(
@@ -592,7 +883,7 @@ def update_pull_request_comment(
         return result
 
     except Exception as e:
-        print(f"Error updating pull request comment: {str(e)}")
+        logger.exception("Error updating pull request comment")
         return {"error": str(e)}
 
 
@@ -619,7 +910,7 @@ def get_pull_request_details(
         Detailed information about the pull request including metadata and relationships
     """
     try:
-        client = AzureDevOpsClient()
+        client = _get_client()
 
         # Get detailed PR information using the Git resource handler
         pr = client.git.get_pull_request_details(
@@ -633,18 +924,7 @@ def get_pull_request_details(
             return {"error": "Pull request not found"}
 
         # Format the response in a LLM-friendly way
-        result = {
-            "id": pr.get("pullRequestId"),
-            "title": pr.get("title"),
-            "description": pr.get("description"),
-            "created_by": pr.get("createdBy", {}).get("displayName"),
-            "source_branch": pr.get("sourceRefName", "").replace("refs/heads/", ""),
-            "target_branch": pr.get("targetRefName", "").replace("refs/heads/", ""),
-            "repository": {
-                "id": pr.get("repository", {}).get("id"),
-                "name": pr.get("repository", {}).get("name"),
-            },
-        }
+        result = {key: extract(pr) for key, extract in _PR_DETAIL_FIELDS}
 
         # Add commits if included and available
         if include_commits and "commits" in pr:
@@ -679,8 +959,9 @@ def get_pull_request_details(
                             )
                             work_item_refs = work_items_response.get("value", [])
                         except Exception as e:
-                            print(
-                                f"Could not fetch work items using direct endpoint: {str(e)}"
+                            logger.warning(
+                                "Could not fetch work items using direct endpoint: %s",
+                                e,
                             )
                             work_item_refs = []
                 if not work_item_refs:
@@ -695,15 +976,33 @@ def get_pull_request_details(
                     ]
                     return result
 
-                # Enhanced work item details
+                # Enhanced work item details, fetched in one batched request
+                work_item_ids = [
+                    int(work_item_ref["id"])
+                    for work_item_ref in work_item_refs
+                    if work_item_ref.get("id")
+                ]
+                try:
+                    # Field projection needs the project; otherwise fetch full items
+                    work_items_by_id = client.work_items.get_many(
+                        project_id,
+                        work_item_ids,
+                        _WORK_ITEM_DETAIL_FIELDS if project_id else None,
+                    )
+                    batch_error = None
+                except Exception as e:
+                    work_items_by_id = {}
+                    batch_error = e
+
                 detailed_work_items = []
 
-                for work_item_ref in work_item_refs:
-                    work_item_id = work_item_ref.get("id")
-                    if not work_item_id:
-                        continue
+                for work_item_id in work_item_ids:
                     try:
-                        work_item_details = client.work_items.get(int(work_item_id))
+                        if batch_error is not None:
+                            raise batch_error
+                        if work_item_id not in work_items_by_id:
+                            raise Exception("Work item not found")
+                        work_item_details = work_items_by_id[work_item_id]
                         fields = work_item_details.get("fields", {})
 
                         work_item_info = {
@@ -749,23 +1048,21 @@ def get_pull_request_details(
                         )
 
                 result["work_items"] = detailed_work_items
-            except Exception as e:
-                print(f"Error handling work items: {str(e)}")
+            except Exception:
+                logger.exception("Error handling work items")
                 result["work_items"] = []
 
         return result
 
     except Exception as e:
-        print(
-            f"Error retrieving PR details for PR {pull_request_id} in repository {repository_id}: {str(e)}"
-        )
+        logger.exception("Error retrieving PR details for PR %s", pull_request_id)
         return {"error": str(e)}
 
 
 def get_project_pull_requests(
     project_id: str,
     status: str = "active",
-    top: Optional[int] = None,
+    top: Optional[int] = 100,
     skip: Optional[int] = None,
 ) -> List[Dict]:
     """
@@ -777,14 +1074,14 @@ def get_project_pull_requests(
     Args:
         project_id: Project ID or name
         status: Filter by PR status ("active", "completed", "abandoned", or "all")
-        top: Maximum number of pull requests to retrieve
+        top: Maximum number of pull requests to retrieve (defaults to 100)
         skip: Number of pull requests to skip (for pagination)
 
     Returns:
         List of pull requests with their details including title, description, creator, status, and related work items
     """
     try:
-        client = AzureDevOpsClient()
+        client = _get_client()
 
         # Get pull requests using the Git resource handler
         pull_requests = client.git.get_project_pull_requests(
@@ -792,29 +1089,12 @@ def get_project_pull_requests(
         )
 
         # Process the pull requests to make them more LLM-friendly
-        result = []
-        for pr in pull_requests:
-            # Extract the most relevant information
-            pr_info = {
-                "id": pr.get("pullRequestId"),
-                "title": pr.get("title"),
-                "description": pr.get("description"),
-                "status": pr.get("status"),
-                "created_by": pr.get("createdBy", {}).get("displayName"),
-                "creation_date": pr.get("creationDate"),
-                "source_branch": pr.get("sourceRefName", "").replace("refs/heads/", ""),
-                "target_branch": pr.get("targetRefName", "").replace("refs/heads/", ""),
-                "repository": {
-                    "id": pr.get("repository", {}).get("id"),
-                    "name": pr.get("repository", {}).get("name"),
-                },
-                "url": pr.get("url"),
-            }
-            result.append(pr_info)
-
-        return result
-    except Exception as e:
-        print(f"Error retrieving pull requests for project {project_id}: {str(e)}")
+        return [
+            {key: extract(pr) for key, extract in _PR_LIST_FIELDS}
+            for pr in pull_requests
+        ]
+    except Exception:
+        logger.exception("Error retrieving pull requests for project %s", project_id)
         return []
 
 
@@ -859,27 +1139,18 @@ def update_pull_request(
         Updated pull request information with status and any new changes applied
     """
     try:
-        client = AzureDevOpsClient()
+        client = _get_client()
 
         # Set up completion options if any are provided
-        completion_options = None
-        if any(
-            [
-                delete_source_branch is not None,
-                merge_strategy is not None,
-                merge_commit_message is not None,
-            ]
-        ):
-            completion_options = {}
-
-            if delete_source_branch is not None:
-                completion_options["deleteSourceBranch"] = delete_source_branch
-
-            if merge_strategy is not None:
-                completion_options["mergeStrategy"] = merge_strategy
-
-            if merge_commit_message is not None:
-                completion_options["mergeCommitMessage"] = merge_commit_message
+        completion_options = {
+            key: value
+            for key, value in (
+                ("deleteSourceBranch", delete_source_branch),
+                ("mergeStrategy", merge_strategy),
+                ("mergeCommitMessage", merge_commit_message),
+            )
+            if value is not None
+        } or None
 
         # Update the pull request using the Git resource handler
         updated_pr = client.git.update_pull_request(
@@ -898,22 +1169,7 @@ def update_pull_request(
         if not updated_pr:
             return {"error": "Failed to update pull request"}
 
-        result = {
-            "id": updated_pr.get("pullRequestId"),
-            "title": updated_pr.get("title"),
-            "description": updated_pr.get("description"),
-            "status": updated_pr.get("status"),
-            "source_branch": updated_pr.get("sourceRefName", "").replace(
-                "refs/heads/", ""
-            ),
-            "target_branch": updated_pr.get("targetRefName", "").replace(
-                "refs/heads/", ""
-            ),
-            "created_by": updated_pr.get("createdBy", {}).get("displayName"),
-            "merge_status": updated_pr.get("mergeStatus"),
-            "url": updated_pr.get("url"),
-            "is_auto_complete": updated_pr.get("autoCompleteSetBy") is not None,
-        }
+        result = {key: extract(updated_pr) for key, extract in _PR_UPDATE_FIELDS}
 
         # Add completion options if present
         if "completionOptions" in updated_pr:
@@ -922,7 +1178,7 @@ def update_pull_request(
         return result
 
     except Exception as e:
-        print(f"Error updating pull request {pull_request_id}: {str(e)}")
+        logger.exception("Error updating pull request %s", pull_request_id)
         return {"error": str(e)}
 
 
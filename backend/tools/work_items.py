@@ -5,15 +5,33 @@ This module provides functions for working with Azure DevOps work items.
 It uses the AzureDevOpsClient for all API interactions.
 """
 
-import sys
-import os
+import atexit
+import logging
+import threading
 from typing import Dict, List, Optional
 
-# Add the parent directory to sys.path to enable relative imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.azure.client import AzureDevOpsClient
 
-# Import the AzureDevOpsClient from the azure module
-from azure.client import AzureDevOpsClient
+logger = logging.getLogger(__name__)
+
+# One client per process so every tool call reuses the same connection pool
+_client: Optional[AzureDevOpsClient] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> AzureDevOpsClient:
+    """Get the shared Azure DevOps client, creating it on first use.
+
+    Returns:
+        The process-wide client
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = AzureDevOpsClient()
+                atexit.register(_client.close)
+    return _client
 
 
 def get_projects() -> List[Dict]:
@@ -23,11 +41,10 @@ def get_projects() -> List[Dict]:
         List of projects in the Azure DevOps organization
     """
     try:
-        print("hello")
-        client = AzureDevOpsClient()
+        client = _get_client()
         return client.projects.get_all()
-    except Exception as e:
-        print(f"Error retrieving projects: {str(e)}")
+    except Exception:
+        logger.exception("Error retrieving projects")
         return []
 
 
@@ -45,10 +62,31 @@ def get_work_items(
         List of work items matching the query
     """
     try:
-        client = AzureDevOpsClient()
+        client = _get_client()
         return client.work_items.query(project, query_text, top)
-    except Exception as e:
-        print(f"Error querying work items: {str(e)}")
+    except Exception:
+        logger.exception("Error querying work items")
+        return []
+
+
+async def aget_work_items(
+    project: str, query_text: str, top: Optional[int] = None
+) -> List[Dict]:
+    """Asynchronously query work items using WIQL (Work Item Query Language).
+
+    Args:
+        project: Project name or ID
+        query_text: WIQL query text iclude a where clause for the project, example: WHERE [System.TeamProject] = 'Power to X'
+        top: Maximum number of items to return
+
+    Returns:
+        List of work items matching the query
+    """
+    try:
+        client = _get_client()
+        return await client.work_items.aquery(project, query_text, top)
+    except Exception:
+        logger.exception("Error querying work items")
         return []
 
 
@@ -62,13 +100,81 @@ def get_work_item(work_item_id: int) -> Dict:
         Work item data
     """
     try:
-        client = AzureDevOpsClient()
+        client = _get_client()
         return client.work_items.get(work_item_id)
-    except Exception as e:
-        print(f"Error retrieving work item {work_item_id}: {str(e)}")
+    except Exception:
+        logger.exception("Error retrieving work item %s", work_item_id)
         return {}
 
 
+async def aget_work_item(work_item_id: int) -> Dict:
+    """Asynchronously get a work item by ID.
+
+    Args:
+        work_item_id: ID of the work item
+
+    Returns:
+        Work item data
+    """
+    try:
+        client = _get_client()
+        return await client.work_items.aget(work_item_id)
+    except Exception:
+        logger.exception("Error retrieving work item %s", work_item_id)
+        return {}
+
+
+def get_work_items_by_ids(
+    project: str, work_item_ids: List[int], fields: Optional[List[str]] = None
+) -> List[Dict]:
+    """Get several work items by ID with one request per 200 IDs instead of one per ID.
+
+    Args:
+        project: Project name or ID
+        work_item_ids: IDs of the work items to fetch
+        fields: Fields to return for each work item, e.g. ["System.Title", "System.State"]; all fields if omitted
+
+    Returns:
+        Work item data in the order of the requested IDs; IDs that do not exist are left out
+    """
+    try:
+        client = _get_client()
+        work_items = client.work_items.get_many(project, work_item_ids, fields)
+        return _in_requested_order(work_items, work_item_ids)
+    except Exception:
+        logger.exception("Error retrieving work items %s", work_item_ids)
+        return []
+
+
+async def aget_work_items_by_ids(
+    project: str, work_item_ids: List[int], fields: Optional[List[str]] = None
+) -> List[Dict]:
+    """Asynchronously get several work items by ID with one request per 200 IDs, fetched concurrently.
+
+    Args:
+        project: Project name or ID
+        work_item_ids: IDs of the work items to fetch
+        fields: Fields to return for each work item, e.g. ["System.Title", "System.State"]; all fields if omitted
+
+    Returns:
+        Work item data in the order of the requested IDs; IDs that do not exist are left out
+    """
+    try:
+        client = _get_client()
+        work_items = await client.work_items.aget_many(project, work_item_ids, fields)
+        return _in_requested_order(work_items, work_item_ids)
+    except Exception:
+        logger.exception("Error retrieving work items %s", work_item_ids)
+        return []
+
+
+def _in_requested_order(
+    work_items: Dict[int, Dict], work_item_ids: List[int]
+) -> List[Dict]:
+    """List work items keyed by ID in the order they were requested, skipping missing ones."""
+    return [work_items[i] for i in work_item_ids if i in work_items]
+
+
 def update_work_item(work_item_id: int, project: str, updates: list) -> Dict:
     """Update an existing work item, you can change the title, description, assigned to, state, add comments and link the work item to a PR.
 
@@ -81,10 +187,29 @@ def update_work_item(work_item_id: int, project: str, updates: list) -> Dict:
         Updated work item data
     """
     try:
-        client = AzureDevOpsClient()
+        client = _get_client()
         return client.work_items.update(work_item_id, project, updates)
-    except Exception as e:
-        print(f"Error updating work item {work_item_id}: {str(e)}")
+    except Exception:
+        logger.exception("Error updating work item %s", work_item_id)
+        return {}
+
+
+async def aupdate_work_item(work_item_id: int, project: str, updates: list) -> Dict:
+    """Asynchronously update an existing work item, you can change the title, description, assigned to, state, add comments and link the work item to a PR.
+
+    Args:
+        work_item_id: ID of the work item to update
+        project: Project name or ID
+        updates: List of update operations in the format: [{"op": "add", "path": "/fields/System.Title", "value": "New Title"}]
+
+    Returns:
+        Updated work item data
+    """
+    try:
+        client = _get_client()
+        return await client.work_items.aupdate(work_item_id, project, updates)
+    except Exception:
+        logger.exception("Error updating work item %s", work_item_id)
         return {}
 
 
@@ -110,23 +235,93 @@ def create_work_item(
         Created work item data
     """
     try:
-        client = AzureDevOpsClient()
+        client = _get_client()
+        work_item_fields = _work_item_fields(title, description, assigned_to, fields)
+        return client.work_items.create(project, work_item_type, work_item_fields)
+    except Exception:
+        logger.exception("Error creating work item")
+        return {}
 
-        # Prepare fields
-        work_item_fields = {"System.Title": title, **fields}
 
-        if description:
-            work_item_fields["System.Description"] = description
+async def acreate_work_item(
+    project: str,
+    work_item_type: str,
+    title: str,
+    description: Optional[str] = None,
+    assigned_to: Optional[str] = None,
+    **fields,
+) -> Dict:
+    """Asynchronously create a new work item.
 
-        if assigned_to:
-            work_item_fields["System.AssignedTo"] = assigned_to
+    Args:
+        project: Project name or ID
+        work_item_type: Type of work item (Bug, Task, etc.)
+        title: Title of the work item
+        description: Description of the work item
+        assigned_to: User to assign the work item to
+        **fields: Additional fields to set on the work item
 
-        return client.work_items.create(project, work_item_type, work_item_fields)
-    except Exception as e:
-        print(f"Error creating work item: {str(e)}")
+    Returns:
+        Created work item data
+    """
+    try:
+        client = _get_client()
+        work_item_fields = _work_item_fields(title, description, assigned_to, fields)
+        return await client.work_items.acreate(
+            project, work_item_type, work_item_fields
+        )
+    except Exception:
+        logger.exception("Error creating work item")
         return {}
 
 
+def create_work_items_bulk(project: str, items: List[Dict]) -> List[Dict]:
+    """Create several work items at once, with one request per 200 items instead of one per item.
+
+    Args:
+        project: Project name or ID
+        items: Work items to create, each a dict with "work_item_type" and "title" and optionally
+            "description", "assigned_to" and "fields" (additional fields to set)
+
+    Returns:
+        One entry per item, in the order given: the created work item data, or a dict with an
+        "error" key if that item may not have been created (do not blindly retry those, check first)
+    """
+    try:
+        client = _get_client()
+        work_items = [
+            (
+                item["work_item_type"],
+                _work_item_fields(
+                    item["title"],
+                    item.get("description"),
+                    item.get("assigned_to"),
+                    item.get("fields", {}),
+                ),
+            )
+            for item in items
+        ]
+        return client.work_items.batch_create(project, work_items)
+    except Exception:
+        logger.exception("Error creating work items")
+        return []
+
+
+def _work_item_fields(
+    title: str, description: Optional[str], assigned_to: Optional[str], fields: Dict
+) -> Dict:
+    """Prepare the fields of a new work item."""
+    work_item_fields = {"System.Title": title, **fields}
+
+    if description:
+        work_item_fields["System.Description"] = description
+
+    if assigned_to:
+        work_item_fields["System.AssignedTo"] = assigned_to
+
+    return work_item_fields
+
+
 # Example usage
 if __name__ == "__main__":
     # Get all projects
@@ -153,12 +348,17 @@ if __name__ == "__main__":
                         f"- Work Item #{item.get('id')}: {item.get('fields', {}).get('System.Title', 'No Title')}"
                     )
 
-                # Example: get details of the first work item
-                if work_items:
-                    first_item_id = work_items[0].get("id")
-                    print(f"\nGetting details for Work Item #{first_item_id}:")
-                    details = get_work_item(first_item_id)
-                    print(f"Title: {details.get('fields', {}).get('System.Title')}")
-                    print(f"State: {details.get('fields', {}).get('System.State')}")
+                # Example: get details of all returned work items at once
+                print(f"\nGetting details for {len(work_items)} work items:")
+                details = get_work_items_by_ids(
+                    first_project,
+                    [item.get("id") for item in work_items],
+                    ["System.Title", "System.State"],
+                )
+                for work_item in details:
+                    fields = work_item.get("fields", {})
+                    print(
+                        f"- #{work_item.get('id')} {fields.get('System.Title')} ({fields.get('System.State')})"
+                    )
             else:
                 print(f"No work items found in {first_project}")